@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Regenerate config/defaults.json from config/defaults.yaml.
+
+The JSON copy is what Settings loads on a cold start without a user
+config (JSON parses much faster than YAML). Run this after editing
+defaults.yaml:
+
+    python scripts/build_defaults.py
+"""
+
+import json
+from pathlib import Path
+
+import yaml
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "src" / "terminalbot" / "config"
+
+
+def main() -> None:
+    """Convert defaults.yaml to defaults.json."""
+    yaml_path = CONFIG_DIR / "defaults.yaml"
+    json_path = CONFIG_DIR / "defaults.json"
+
+    with open(yaml_path) as f:
+        data = yaml.safe_load(f) or {}
+
+    with open(json_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+    print(f"Wrote {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,17 @@
 __version__ = "0.1.0"
 __author__ = "TerminalBot Contributors"
 
-from .config import get_settings
-from .executor import CommandExecutor
-
 __all__ = ["__version__", "get_settings", "CommandExecutor"]
+
+
+def __getattr__(name: str):
+    """Import public names on first access so the CLI starts without pydantic."""
+    if name == "get_settings":
+        from .config import get_settings
+
+        return get_settings
+    if name == "CommandExecutor":
+        from .executor import CommandExecutor
+
+        return CommandExecutor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,45 @@
 """Agent coordinator for orchestrating LLM and tools."""
 
+import dataclasses
 import logging
 import os
-from typing import Dict, List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from ..llm import BaseLLMProvider, get_llm_provider
+from ..config import get_settings
 from ..plugins.base import BasePlugin
-from .prompts import get_results_analysis_prompt, get_system_prompt
+from ..utils import TTLCache
+from .prompts import get_results_analysis_prompt, get_system_prompt, get_tools_fingerprint
 from .rule_based import get_matcher
 
+if TYPE_CHECKING:
+    from ..llm import BaseLLMProvider
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class QueryResult:
+    """Result of processing a user query."""
+
+    success: bool
+    mode: str  # "rule-based", "llm" or "none"
+    query: Optional[str] = None
+    command: Optional[str] = None
+    requires_execution: bool = False
+    response: Optional[str] = None
+    provider: Optional[str] = None
+    error: Optional[str] = None
+    suggestions: List[str] = field(default_factory=list)
+
+
+def _copy_result(result: QueryResult) -> QueryResult:
+    """Copy a result so the cached one can't be changed through it."""
+    return dataclasses.replace(result, suggestions=list(result.suggestions))
+
+
 class AgentCoordinator:
     """
     Coordinates LLM agent with available plugins and tools.
@@ -23,7 +51,7 @@ class AgentCoordinator:
     def __init__(
         self,
         plugins: List[BasePlugin],
-        llm_provider: Optional[BaseLLMProvider] = None,
+        llm_provider: Optional["BaseLLMProvider"] = None,
         settings=None,
     ):
         """
@@ -36,23 +64,63 @@ class AgentCoordinator:
         """
         self.plugins = plugins
         self._llm_provider = llm_provider
+        self._llm_lock = threading.Lock()
+        self._llm_loaded = llm_provider is not None
         self.settings = settings
         self.matcher = get_matcher()  # Rule-based matcher
 
+        # Successful results for recently repeated queries
+        cache_ttl = (settings or get_settings()).performance.cache_ttl
+        self._query_cache = TTLCache(maxsize=256, ttl=cache_ttl)
+
+        # (cwd, monotonic time it was read) - see _get_current_dir()
+        self._cwd_cache: Optional[Tuple[str, float]] = None
+
         logger.info(f"Initialized coordinator with {len(plugins)} plugins")
 
     @property
-    def llm_provider(self) -> Optional[BaseLLMProvider]:
+    def plugins(self) -> List[BasePlugin]:
+        """Available plugins."""
+        return self._plugins
+
+    @plugins.setter
+    def plugins(self, plugins: List[BasePlugin]) -> None:
+        """Replace plugins and refresh the cached tool fingerprint."""
+        self._plugins = plugins
+        self._tools_fingerprint = get_tools_fingerprint(plugins)
+
+    @property
+    def llm_provider(self) -> Optional["BaseLLMProvider"]:
         """Lazy load LLM provider."""
-        if self._llm_provider is None:
-            self._llm_provider = get_llm_provider(self.settings)
-            if self._llm_provider:
-                logger.info(f"Loaded LLM provider: {self._llm_provider.get_name()}")
-            else:
-                logger.info("No LLM provider available - using rule-based mode only")
+        if self._llm_provider is None and not self._llm_loaded:
+            # Waits for a load already started by warm_llm_provider()
+            with self._llm_lock:
+                if self._llm_provider is None and not self._llm_loaded:
+                    # Imported here so rule-based-only runs never load the LLM package
+                    from ..llm import get_llm_provider
+
+                    self._llm_provider = get_llm_provider(self.settings)
+                    # Don't probe every provider again when none was available
+                    self._llm_loaded = True
+                    if self._llm_provider:
+                        logger.info(f"Loaded LLM provider: {self._llm_provider.get_name()}")
+                    else:
+                        logger.info("No LLM provider available - using rule-based mode only")
         return self._llm_provider
 
-    def process_query(self, query: str, force_llm: bool = False) -> Dict:
+    def warm_llm_provider(self) -> None:
+        """
+        Start loading the LLM provider in the background.
+
+        The SDK import and availability check then overlap with rule-based
+        matching and command execution instead of delaying the first LLM call.
+        """
+        if self._llm_provider is None and not self._llm_loaded:
+            threading.Thread(
+                target=lambda: self.llm_provider, name="llm-warmup", daemon=True
+            ).start()
+
+    def process_query(self, query: str, force_llm: bool = False) -> QueryResult:
         """
         Process user query and generate response.
 
@@ -61,41 +129,146 @@ class AgentCoordinator:
             force_llm: Force LLM usage even if rule-based match exists
 
         Returns:
-            Dict with response and metadata
+            QueryResult with response and metadata
         """
         # Get current working directory for context
-        current_dir = os.getcwd()
+        current_dir = self._get_current_dir()
+
+        cache_key = (query, force_llm, current_dir)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Query cache hit: {query}")
+            return _copy_result(cached)
+
+        result = self._resolve_query(query, force_llm, current_dir)
+
+        # Never cache failures, so a transient error is retried next time
+        if result.success:
+            self._query_cache.set(cache_key, _copy_result(result))
+
+        return result
 
+    def _get_current_dir(self) -> str:
+        """
+        Get the working directory, re-reading it at most once per second.
+
+        Returns:
+            Current working directory
+        """
+        now = time.monotonic()
+        if self._cwd_cache is None or now - self._cwd_cache[1] > 1.0:
+            self._cwd_cache = (os.getcwd(), now)
+        return self._cwd_cache[0]
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        self._query_cache.clear()
+
+    def _resolve_query(self, query: str, force_llm: bool, current_dir: str) -> QueryResult:
+        """
+        Resolve a query with rules first, then the LLM.
+
+        Args:
+            query: User query
+            force_llm: Skip rule-based matching
+            current_dir: Current working directory
+
+        Returns:
+            QueryResult with response and metadata
+        """
         # Try rule-based matching first (unless forced to use LLM)
         if not force_llm:
-            match_result = self.matcher.match(query)
-            if match_result:
-                command, groups = match_result
-                logger.info(f"Rule-based match: {command}")
-
-                return {
-                    "success": True,
-                    "mode": "rule-based",
-                    "command": command,
-                    "query": query,
-                    "requires_execution": True,
-                }
+            rule_result = self._process_with_rules(query)
+            if rule_result:
+                return rule_result
 
         # Fall back to LLM if available
         if self.llm_provider:
             logger.info("Using LLM to process query")
             return self._process_with_llm(query, current_dir)
 
-        # No match and no LLM available
-        logger.warning("No match found and no LLM available")
-        return {
-            "success": False,
-            "mode": "none",
-            "error": "Could not understand query. Try being more specific, or enable LLM support.",
-            "suggestions": self.matcher.get_suggestions(query),
-        }
+        return self._no_match_result(query)
+
+    def process_queries(self, queries: List[str], force_llm: bool = False) -> List[QueryResult]:
+        """
+        Process several queries, sending all LLM-bound ones in one batch.
+
+        Rule-based matches are resolved locally; the remaining queries share
+        a single system prompt and are handed to the provider together.
+
+        Args:
+            queries: User queries in natural language
+            force_llm: Force LLM usage even if rule-based match exists
+
+        Returns:
+            List of QueryResults, in the same order as queries
+        """
+        current_dir = self._get_current_dir()
+        results: List[Optional[QueryResult]] = [None] * len(queries)
+        pending: List[int] = []
+
+        for i, query in enumerate(queries):
+            if not force_llm:
+                results[i] = self._process_with_rules(query)
+            if results[i] is None:
+                pending.append(i)
+
+        if pending and self.llm_provider:
+            if len(pending) == 1:
+                i = pending[0]
+                results[i] = self._process_with_llm(queries[i], current_dir)
+            else:
+                logger.info(f"Using LLM to process {len(pending)} queries in one batch")
+                batch = self._process_batch_with_llm([queries[i] for i in pending], current_dir)
+                for i, result in zip(pending, batch, strict=True):
+                    results[i] = result
+
+        # Without an LLM, queries no rule matched are left unanswered
+        return [
+            result if result is not None else self._no_match_result(query)
+            for query, result in zip(queries, results, strict=True)
+        ]
+
+    def _process_with_rules(self, query: str) -> Optional[QueryResult]:
+        """
+        Process query using the rule-based matcher.
+
+        Args:
+            query: User query
 
-    def _process_with_llm(self, query: str, current_dir: str) -> Dict:
+        Returns:
+            QueryResult with matched command, or None if no rule matched
+        """
+        match_result = self.matcher.match(query)
+        if not match_result:
+            return None
+
+        command, groups = match_result
+        logger.info(f"Rule-based match: {command}")
+
+        return QueryResult(
+            success=True,
+            mode="rule-based",
+            command=command,
+            query=query,
+            requires_execution=True,
+        )
+
+    def _no_match_result(self, query: str) -> QueryResult:
+        """Build the result for a query nothing could handle."""
+        logger.warning("No match found and no LLM available")
+        return QueryResult(
+            success=False,
+            mode="none",
+            error="Could not understand query. Try being more specific, or enable LLM support.",
+            suggestions=self.matcher.get_suggestions(query),
+        )
+
+    def _build_llm_prompt(self, query: str) -> str:
+        """Wrap a user query into the LLM user prompt."""
+        return f"User query: {query}\n\nProvide helpful guidance for this query."
+
+    def _process_with_llm(self, query: str, current_dir: str) -> QueryResult:
         """
         Process query using LLM.
 
@@ -104,42 +277,100 @@ class AgentCoordinator:
             current_dir: Current working directory
 
         Returns:
-            Dict with LLM response
+            QueryResult with LLM response
+        """
+        provider = self.llm_provider
+        assert provider is not None  # callers only get here with a provider loaded
+
+        # Generate system prompt with tool descriptions
+        system_prompt = get_system_prompt(
+            self.plugins, current_dir, tools_fingerprint=self._tools_fingerprint
+        )
+
+        # For now, we'll do simple LLM query without tool calling
+        # (Full LangChain integration would be added in next iteration)
+        result = provider.try_generate(
+            prompt=self._build_llm_prompt(query),
+            system_prompt=system_prompt,
+        )
+
+        if not result.success:
+            logger.error(f"LLM processing failed: {result.error}")
+            return QueryResult(
+                success=False,
+                mode="llm",
+                error=f"LLM processing failed: {result.error}",
+            )
+
+        return QueryResult(
+            success=True,
+            mode="llm",
+            response=result.response,
+            query=query,
+            provider=provider.get_name(),
+        )
+
+    def _process_batch_with_llm(self, queries: List[str], current_dir: str) -> List[QueryResult]:
         """
+        Process several queries with one batched LLM call.
+
+        Args:
+            queries: User queries
+            current_dir: Current working directory
+
+        Returns:
+            List of QueryResults with LLM responses, in the same order as queries
+        """
+        provider = self.llm_provider
+        assert provider is not None  # callers only get here with a provider loaded
+
         try:
-            # Generate system prompt with tool descriptions
-            system_prompt = get_system_prompt(self.plugins, current_dir)
+            # Identical system prompt across the batch keeps prefix caching effective
+            system_prompt = get_system_prompt(
+                self.plugins, current_dir, tools_fingerprint=self._tools_fingerprint
+            )
 
-            # For now, we'll do simple LLM query without tool calling
-            # (Full LangChain integration would be added in next iteration)
-            response = self.llm_provider.generate(
-                prompt=f"User query: {query}\n\nProvide helpful guidance for this query.",
+            responses = provider.generate_batch(
+                prompts=[self._build_llm_prompt(query) for query in queries],
                 system_prompt=system_prompt,
             )
-
-            return {
-                "success": True,
-                "mode": "llm",
-                "response": response,
-                "query": query,
-                "provider": self.llm_provider.get_name(),
-            }
+            provider_name = provider.get_name()
+
+            return [
+                QueryResult(
+                    success=True,
+                    mode="llm",
+                    response=response,
+                    query=query,
+                    provider=provider_name,
+                )
+                for query, response in zip(queries, responses, strict=True)
+            ]
 
         except Exception as e:
-            logger.error(f"LLM processing failed: {e}")
-            return {
-                "success": False,
-                "mode": "llm",
-                "error": f"LLM processing failed: {str(e)}",
-            }
-
-    def analyze_results(self, query: str, results: str) -> str:
+            logger.error(f"LLM batch processing failed: {e}")
+            return [
+                QueryResult(
+                    success=False,
+                    mode="llm",
+                    error=f"LLM processing failed: {str(e)}",
+                )
+                for _ in queries
+            ]
+
+    def analyze_results(
+        self,
+        query: str,
+        results: str,
+        callback: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """
         Analyze command results using LLM.
 
         Args:
             query: Original query
             results: Command execution results
+            callback: Called with each chunk as it is generated (streams if set)
 
         Returns:
             Analysis and recommendations
@@ -147,10 +378,21 @@ class AgentCoordinator:
         if not self.llm_provider:
             return results  # Return raw results if no LLM
 
+        prompt = get_results_analysis_prompt(query, results)
+
+        if callback is None:
+            result = self.llm_provider.try_generate(prompt)
+            if not result.success:
+                logger.error(f"Result analysis failed: {result.error}")
+                return results  # Fall back to raw results
+            return result.response
+
         try:
-            prompt = get_results_analysis_prompt(query, results)
-            analysis = self.llm_provider.generate(prompt)
-            return analysis
+            chunks = []
+            for chunk in self.llm_provider.generate_stream(prompt):
+                callback(chunk)
+                chunks.append(chunk)
+            return "".join(chunks)
 
         except Exception as e:
             logger.error(f"Result analysis failed: {e}")
@@ -160,6 +402,22 @@ class AgentCoordinator:
         """
         List all available capabilities.
 
+        Returns:
+            List of capability descriptions
+        """
+        return self.list_capabilities_static(self.plugins, self.llm_provider)
+
+    @staticmethod
+    def list_capabilities_static(
+        plugins: List[BasePlugin], llm_provider: Optional["BaseLLMProvider"] = None
+    ) -> List[str]:
+        """
+        List capabilities without constructing a coordinator.
+
+        Args:
+            plugins: Plugins to describe (only name and description are used)
+            llm_provider: Loaded LLM provider, or None if unavailable
+
         Returns:
             List of capability descriptions
         """
@@ -167,17 +425,17 @@ class AgentCoordinator:
 
         # Add rule-based capabilities
         capabilities.append("**Rule-based capabilities:**")
-        for cap in self.matcher.list_capabilities()[:10]:  # Show first 10
+        for cap in get_matcher().list_capabilities()[:10]:  # Show first 10
             capabilities.append(f"  - {cap}")
 
         # Add plugin capabilities
         capabilities.append("\n**Available plugins:**")
-        for plugin in self.plugins:
+        for plugin in plugins:
             capabilities.append(f"  - {plugin.name}: {plugin.description}")
 
         # Add LLM status
-        if self.llm_provider:
-            info = self.llm_provider.get_model_info()
+        if llm_provider:
+            info = llm_provider.get_model_info()
             capabilities.append(
                 f"\n**LLM available:** {info['provider']} ({info.get('model', 'unknown')})"
             )
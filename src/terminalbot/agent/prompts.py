@@ -1,18 +1,57 @@
 """System prompts for LLM agent."""
 
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from ..plugins.base import BasePlugin
 
+# (plugin name, plugin description, ((tool name, tool description), ...))
+ToolsFingerprint = Tuple[Tuple[str, str, Tuple[Tuple[str, str], ...]], ...]
 
-def get_system_prompt(plugins: List[BasePlugin], current_dir: str = None) -> str:
+
+def _plugin_fingerprint(plugin: BasePlugin) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    """Summarize a single plugin's tools."""
+    return (
+        plugin.name,
+        plugin.description,
+        tuple((tool["name"], tool["description"]) for tool in plugin.get_tools()),
+    )
+
+
+def get_tools_fingerprint(plugins: List[BasePlugin]) -> ToolsFingerprint:
+    """
+    Build a hashable summary of the plugins' tool descriptions.
+
+    Plugins are independent, so their tools are gathered concurrently in
+    case a plugin probes the system while building its tool list.
+
+    Args:
+        plugins: List of available plugins
+
+    Returns:
+        Tuple usable as a cache key for the system prompt
+    """
+    if len(plugins) <= 1:
+        return tuple(_plugin_fingerprint(plugin) for plugin in plugins)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(plugins))) as pool:
+        return tuple(pool.map(_plugin_fingerprint, plugins))
+
+
+def get_system_prompt(
+    plugins: List[BasePlugin],
+    current_dir: str = None,
+    tools_fingerprint: Optional[ToolsFingerprint] = None,
+) -> str:
     """
     Generate system prompt for the LLM agent.
 
     Args:
         plugins: List of available plugins
         current_dir: Current working directory (default: cwd)
+        tools_fingerprint: Precomputed result of get_tools_fingerprint(plugins)
 
     Returns:
         System prompt string
@@ -20,12 +59,21 @@ def get_system_prompt(plugins: List[BasePlugin], current_dir: str = None) -> str
     if current_dir is None:
         current_dir = os.getcwd()
 
+    if tools_fingerprint is None:
+        tools_fingerprint = get_tools_fingerprint(plugins)
+
+    return _build_system_prompt(tools_fingerprint, current_dir)
+
+
+@lru_cache(maxsize=32)
+def _build_system_prompt(tools_fingerprint: ToolsFingerprint, current_dir: str) -> str:
+    """Render the system prompt (cached per plugin set and directory)."""
     # Build tool descriptions
     tool_descriptions = []
-    for plugin in plugins:
-        tool_descriptions.append(f"\n**{plugin.name.upper()} Plugin** - {plugin.description}")
-        for tool in plugin.get_tools():
-            tool_descriptions.append(f"  - {tool['name']}: {tool['description']}")
+    for plugin_name, plugin_description, tools in tools_fingerprint:
+        tool_descriptions.append(f"\n**{plugin_name.upper()} Plugin** - {plugin_description}")
+        for tool_name, tool_description in tools:
+            tool_descriptions.append(f"  - {tool_name}: {tool_description}")
 
     tools_section = "\n".join(tool_descriptions)
 
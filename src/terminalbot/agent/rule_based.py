@@ -2,12 +2,19 @@
 
 import logging
 import re
-from typing import List, Optional, Tuple
+import threading
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 
 # Command pattern mappings (regex pattern -> command template)
+#
+# Patterns are deliberately unanchored: they match anywhere in free-form
+# phrasings ("can you show disk space?"), so adding ^...$ would drop matches.
+# RuleBasedMatcher fuses them into one pattern applied with re.match at
+# position 0, so there is no per-pattern restart loop to anchor away.
 COMMAND_PATTERNS = {
     # Process queries
     r"(?:is|check).*nginx.*(?:running|up|active)": "systemctl status nginx",
@@ -51,6 +58,25 @@ COMMAND_PATTERNS = {
     r"(?:show|list).*environment.*variables": "env",
 }
 
+def _compile_template(template: str, group_count: int) -> Callable[[Sequence[Optional[str]]], str]:
+    """
+    Turn a command template into a renderer for captured groups.
+
+    Templates use 1-based ``{1}``, ``{2}`` placeholders; they are rewritten to
+    0-based ``str.format`` fields once, so rendering is a single format call.
+    """
+    if not group_count:
+        return lambda groups: template
+
+    format_string = re.sub(r"\{(\d+)\}", lambda m: f"{{{int(m.group(1)) - 1}}}", template)
+    return lambda groups: format_string.format(*(group or "" for group in groups))
+
+
+# Patterns are static, so compile them once at import time
+_COMPILED_PATTERNS: Tuple[Tuple["re.Pattern[str]", str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), command) for pattern, command in COMMAND_PATTERNS.items()
+)
+
 
 class RuleBasedMatcher:
     """
@@ -62,13 +88,76 @@ class RuleBasedMatcher:
 
     def __init__(self):
         """Initialize matcher with compiled patterns."""
-        # Compile patterns for better performance
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), command)
-            for pattern, command in COMMAND_PATTERNS.items()
-        ]
+        self.compiled_patterns = _COMPILED_PATTERNS
+        self._keyword_index = self._build_keyword_index()
+        self._renderers: List[Callable[[Sequence[Optional[str]]], str]] = []
+        self._group_slices: List[slice] = []
+        self._combined = self._build_combined_pattern()
+        self._prefilter = self._build_prefilter()
         logger.info(f"Initialized rule-based matcher with {len(self.compiled_patterns)} patterns")
 
+    def _build_keyword_index(self) -> Dict[str, List[int]]:
+        """
+        Map each literal word in the patterns to the rules that contain it.
+
+        Escapes such as ``\\s`` and ``\\w`` are dropped so only real keywords
+        (e.g. "disk", "nginx") are indexed.
+        """
+        index: Dict[str, List[int]] = defaultdict(list)
+
+        for i, (pattern, _) in enumerate(self.compiled_patterns):
+            source = re.sub(r"\\.", " ", pattern.pattern.lower())
+            for keyword in dict.fromkeys(re.findall(r"[a-z]+", source)):
+                index[keyword].append(i)
+
+        return dict(index)
+
+    def _build_prefilter(self) -> Optional["re.Pattern[str]"]:
+        """
+        Build a literal prefilter that must hit before any rule can match.
+
+        Every rule starts with a required word or a ``(?:a|b)`` group of
+        words, so a query containing none of those literals cannot match and
+        is rejected without running the fused pattern. Returns None (no
+        prefiltering) if any rule's leading literals cannot be determined.
+        """
+        anchors: Set[str] = set()
+
+        for pattern, _ in self.compiled_patterns:
+            leading = re.match(r"\(\?:([\w|]+)\)|(\w+)", pattern.pattern)
+            if not leading:
+                return None
+            words = (leading.group(1) or leading.group(2)).split("|")
+            if not all(words):
+                return None
+            anchors.update(words)
+
+        alternatives = "|".join(re.escape(word) for word in sorted(anchors))
+        return re.compile(alternatives, re.IGNORECASE)
+
+    def _build_combined_pattern(self) -> "re.Pattern[str]":
+        """
+        Fuse all rules into a single alternation.
+
+        Each rule becomes ``[\\s\\S]*?(?P<ruleN>...)`` anchored at the start of
+        the query, so the regex engine tries rules in declaration order and the
+        first rule that matches anywhere wins - the same semantics as searching
+        each pattern in turn, but with a single C-level call per query.
+        """
+        alternatives = []
+        group_offset = 0
+
+        for i, (pattern, command) in enumerate(self.compiled_patterns):
+            alternatives.append(f"[\\s\\S]*?(?P<rule{i}>{pattern.pattern})")
+            self._renderers.append(_compile_template(command, pattern.groups))
+
+            # Inner groups of rule i follow its own named group
+            group_offset += 1
+            self._group_slices.append(slice(group_offset, group_offset + pattern.groups))
+            group_offset += pattern.groups
+
+        return re.compile("|".join(alternatives), re.IGNORECASE)
+
     def match(self, query: str) -> Optional[Tuple[str, List[str]]]:
         """
         Match query against command patterns.
@@ -80,28 +169,64 @@ class RuleBasedMatcher:
             Tuple of (command, captured_groups) or None if no match
         """
         query = query.strip()
+        result = self._match_stripped(query)
+
+        if result:
+            logger.info(f"Matched query to command: {result[0]}")
+        else:
+            logger.debug(f"No rule-based match found for: {query}")
+
+        return result
 
-        for pattern, command_template in self.compiled_patterns:
-            match = pattern.search(query)
-            if match:
-                # Extract captured groups for command template substitution
-                groups = match.groups()
+    def match_batch(self, queries: List[str]) -> List[Optional[Tuple[str, List[str]]]]:
+        """
+        Match many queries in one call (e.g. classifying shell history).
 
-                # Substitute placeholders in command template
-                if groups:
-                    # Replace {1}, {2}, etc. with captured groups
-                    command = command_template
-                    for i, group in enumerate(groups, start=1):
-                        if group:
-                            command = command.replace(f"{{{i}}}", group)
-                else:
-                    command = command_template
+        Identical queries are matched once and per-query logging is
+        skipped, so the loop only pays for the regex work.
 
-                logger.info(f"Matched query to command: {command}")
-                return command, list(groups) if groups else []
+        Args:
+            queries: User queries in natural language
 
-        logger.debug(f"No rule-based match found for: {query}")
-        return None
+        Returns:
+            List of (command, captured_groups) or None, in the same order as queries
+        """
+        seen: Dict[str, Optional[Tuple[str, List[str]]]] = {}
+        match_stripped = self._match_stripped
+        results = []
+
+        for query in queries:
+            query = query.strip()
+            if query not in seen:
+                seen[query] = match_stripped(query)
+            result = seen[query]
+            # Fresh group lists so callers can't alias each other's results
+            results.append((result[0], list(result[1])) if result else None)
+
+        matched = sum(1 for result in results if result)
+        logger.info(f"Batch matched {matched} of {len(queries)} queries")
+        return results
+
+    def _match_stripped(self, query: str) -> Optional[Tuple[str, List[str]]]:
+        """Match an already stripped query without logging."""
+        # Cheap literal scan rejects queries that no rule could match
+        if self._prefilter is not None and not self._prefilter.search(query):
+            return None
+
+        match = self._combined.match(query)
+        if not match:
+            return None
+
+        # Every alternative is a named group enclosing the rule's own groups,
+        # so lastgroup names the rule that matched
+        assert match.lastgroup is not None
+        idx = int(match.lastgroup[4:])
+
+        # Extract captured groups and render them into the command template
+        groups = match.groups()[self._group_slices[idx]]
+        command = self._renderers[idx](groups)
+
+        return command, list(groups) if groups else []
 
     def get_suggestions(self, query: str, limit: int = 3) -> List[str]:
         """
@@ -114,23 +239,18 @@ class RuleBasedMatcher:
         Returns:
             List of suggested queries
         """
-        query_lower = query.lower()
-        suggestions = []
+        # Score rules by how many query keywords they contain
+        scores: Counter = Counter()
+        for keyword in set(query.lower().split()):
+            for i in self._keyword_index.get(keyword, ()):
+                scores[i] += 1
 
-        # Extract keywords from query
-        keywords = set(query_lower.split())
-
-        for pattern, _ in self.compiled_patterns[:limit * 2]:  # Check more for better matches
-            pattern_str = pattern.pattern.lower()
-
-            # Count keyword matches
-            matches = sum(1 for kw in keywords if kw in pattern_str)
-
-            if matches > 0:
-                # Create a readable suggestion from the pattern
-                suggestion = self._pattern_to_suggestion(pattern.pattern)
-                if suggestion and suggestion not in suggestions:
-                    suggestions.append(suggestion)
+        suggestions = []
+        for i in sorted(scores, key=lambda i: (-scores[i], i)):
+            # Create a readable suggestion from the pattern
+            suggestion = self._pattern_to_suggestion(self.compiled_patterns[i][0].pattern)
+            if suggestion and suggestion not in suggestions:
+                suggestions.append(suggestion)
 
             if len(suggestions) >= limit:
                 break
@@ -172,11 +292,14 @@ class RuleBasedMatcher:
 
 # Singleton instance
 _matcher: Optional[RuleBasedMatcher] = None
+_matcher_lock = threading.Lock()
 
 
 def get_matcher() -> RuleBasedMatcher:
-    """Get or create rule-based matcher singleton."""
+    """Get or create rule-based matcher singleton (thread-safe)."""
     global _matcher
     if _matcher is None:
-        _matcher = RuleBasedMatcher()
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = RuleBasedMatcher()
     return _matcher
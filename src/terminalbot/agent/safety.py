@@ -2,14 +2,49 @@
 
 import logging
 import re
-from typing import Dict, Optional, Tuple
-
-import psutil
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Dangerous commands that terminate processes and get kill-specific validation
+KILL_COMMANDS = ("kill", "killall", "pkill", "systemctl stop")
+
+
+class _ProcessMatch:
+    """
+    Process matched by name, with its command line read on first access.
+
+    Confirmation prompts usually only need the match count, so the
+    /proc/<pid>/cmdline read and join are deferred until displayed.
+    """
+
+    __slots__ = ("pid", "name", "_proc", "_cmdline")
+
+    def __init__(self, proc: Any, pid: int, name: str):
+        self.pid = pid
+        self.name = name
+        self._proc = proc
+        self._cmdline: Optional[str] = None
+
+    @property
+    def cmdline(self) -> str:
+        """Command line joined into a single string."""
+        if self._cmdline is None:
+            import psutil
+
+            try:
+                self._cmdline = " ".join(self._proc.cmdline())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._cmdline = ""
+        return self._cmdline
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict (reads cmdline)."""
+        return {"pid": self.pid, "name": self.name, "cmdline": self.cmdline}
+
 
 class SafetyValidator:
     """
@@ -24,6 +59,51 @@ class SafetyValidator:
     def __init__(self, settings=None):
         """Initialize safety validator with settings."""
         self.settings = settings or get_settings()
+        self.rebuild_patterns()
+
+    def rebuild_patterns(self) -> None:
+        """
+        Precompile matchers from the current safety settings.
+
+        Called on construction; call again after changing settings.safety.
+        """
+        safety = self.settings.safety
+        self._protected_pids = frozenset(safety.protected_pids)
+
+        # Lowercased name -> configured name, for exact matches and messages
+        self._protected_names = {name.lower(): name for name in safety.protected_processes}
+
+        # One alternative per protected name, tried in configured order, so the
+        # first configured name contained in the process name is reported
+        self._protected_pattern = None
+        if self._protected_names:
+            self._protected_pattern = re.compile(
+                "|".join(f"[\\s\\S]*?({re.escape(name)})" for name in self._protected_names),
+                re.IGNORECASE,
+            )
+
+        # All dangerous commands fused into one word-bounded alternation, with
+        # the process-terminating ones in a named "kill" group
+        self._dangerous_pattern = None
+        if safety.dangerous_commands:
+            kill_cmds = [cmd for cmd in safety.dangerous_commands if cmd.lower() in KILL_COMMANDS]
+            other_cmds = [cmd for cmd in safety.dangerous_commands if cmd.lower() not in KILL_COMMANDS]
+
+            groups = []
+            for group_name, cmds in (("kill", kill_cmds), ("other", other_cmds)):
+                if cmds:
+                    alternatives = "|".join(re.escape(cmd) for cmd in cmds)
+                    groups.append(rf"(?P<{group_name}>\b(?:{alternatives})\b)")
+
+            self._dangerous_pattern = re.compile("|".join(groups), re.IGNORECASE)
+
+        # The agent checks the same few commands and names over and over, so
+        # the pure pattern lookups are memoized; rebuilding starts them afresh.
+        # PID lookups and process listings depend on live state and aren't.
+        self._search_dangerous = None
+        if self._dangerous_pattern is not None:
+            self._search_dangerous = lru_cache(maxsize=1024)(self._dangerous_pattern.search)
+        self._lookup_protected_name = lru_cache(maxsize=1024)(self._match_protected_name)
 
     def is_dangerous_command(self, command: str) -> bool:
         """
@@ -35,17 +115,27 @@ class SafetyValidator:
         Returns:
             True if command requires confirmation
         """
-        command_lower = command.lower().strip()
+        return self._find_dangerous(command) is not None
+
+    def _find_dangerous(self, command: str) -> Optional["re.Match[str]"]:
+        """
+        Find the first dangerous command in a command line.
 
-        # Check against dangerous command list
-        for dangerous_cmd in self.settings.safety.dangerous_commands:
-            # Match command at word boundary (not substring)
-            pattern = r"\b" + re.escape(dangerous_cmd) + r"\b"
-            if re.search(pattern, command_lower):
-                logger.warning(f"Dangerous command detected: {dangerous_cmd}")
-                return True
+        Args:
+            command: Command to check
+
+        Returns:
+            Match whose lastgroup is "kill" or "other", or None if safe
+        """
+        if self._search_dangerous is None:
+            return None
 
-        return False
+        # Match any dangerous command at word boundary (not substring)
+        match = self._search_dangerous(command)
+        if match:
+            logger.warning(f"Dangerous command detected: {match.group(0)}")
+
+        return match
 
     def is_protected_process(self, identifier: str) -> Tuple[bool, Optional[str]]:
         """
@@ -60,10 +150,12 @@ class SafetyValidator:
         # Check if identifier is a PID
         try:
             pid = int(identifier)
-            if pid in self.settings.safety.protected_pids:
+            if pid in self._protected_pids:
                 return True, f"PID {pid} is a protected system process"
 
-            # Get process info to check name
+            # Get process info to check name (psutil imported only when needed)
+            import psutil
+
             try:
                 proc = psutil.Process(pid)
                 process_name = proc.name()
@@ -74,14 +166,34 @@ class SafetyValidator:
             # Identifier is a process name
             process_name = identifier
 
-        # Check against protected process names
-        process_name_lower = process_name.lower()
-        for protected in self.settings.safety.protected_processes:
-            if protected.lower() in process_name_lower:
-                return True, f"'{protected}' is a protected system process"
+        protected = self._lookup_protected_name(process_name)
+        if protected is not None:
+            return True, f"'{protected}' is a protected system process"
 
         return False, None
 
+    def _match_protected_name(self, process_name: str) -> Optional[str]:
+        """
+        Find the protected name a process name contains.
+
+        Args:
+            process_name: Process name
+
+        Returns:
+            Configured protected name, or None if not protected
+        """
+        # Most names are already lowercase, so try an exact lookup before any
+        # case folding
+        protected = self._protected_names.get(process_name)
+
+        if protected is None and self._protected_pattern is not None:
+            match = self._protected_pattern.match(process_name)
+            # Each alternative is one capturing group, so lastindex is set
+            if match and match.lastindex is not None:
+                protected = self._protected_names[match.group(match.lastindex).lower()]
+
+        return protected
+
     def validate_kill_command(self, command: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """
         Validate a kill/killall/pkill command.
@@ -90,7 +202,22 @@ class SafetyValidator:
             command: Command to validate
 
         Returns:
-            Tuple of (is_safe, error_message, process_info)
+            Tuple of (is_safe, error_message, process_info); processes
+            matched by name are listed as plain dicts
+        """
+        is_safe, error, process_info = self._validate_kill_command(command)
+        if process_info and "matching_processes" in process_info:
+            process_info["matching_processes"] = [
+                match.to_dict() for match in process_info["matching_processes"]
+            ]
+        return is_safe, error, process_info
+
+    def _validate_kill_command(self, command: str) -> Tuple[bool, Optional[str], Optional[Dict]]:
+        """
+        Validate a kill/killall/pkill command, keeping name matches lazy.
+
+        Like validate_kill_command(), but processes matched by name are
+        _ProcessMatch objects, so their command lines are only read if used.
         """
         # Extract PIDs or process names from command
         tokens = command.split()
@@ -149,6 +276,8 @@ class SafetyValidator:
         Returns:
             Dict with process info or None
         """
+        import psutil
+
         try:
             # Try as PID first
             try:
@@ -162,17 +291,14 @@ class SafetyValidator:
                     "memory_percent": proc.memory_percent(),
                 }
             except ValueError:
-                # It's a process name
+                # It's a process name - filter on name only; cmdline is
+                # read lazily by _ProcessMatch if it is ever displayed
+                needle = identifier.lower()
                 processes = []
-                for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                    if identifier.lower() in proc.info["name"].lower():
-                        processes.append(
-                            {
-                                "pid": proc.info["pid"],
-                                "name": proc.info["name"],
-                                "cmdline": " ".join(proc.info["cmdline"] or []),
-                            }
-                        )
+                for proc in psutil.process_iter(["pid", "name"]):
+                    name = proc.info["name"] or ""
+                    if needle in name.lower():
+                        processes.append(_ProcessMatch(proc, proc.info["pid"], name))
 
                 if processes:
                     return {"matching_processes": processes, "count": len(processes)}
@@ -195,14 +321,12 @@ class SafetyValidator:
         if not self.settings.safety.require_confirmation:
             return False, None
 
-        # Check if it's a dangerous command
-        if self.is_dangerous_command(command):
+        # Check if it's a dangerous command (one pass also tells us its kind)
+        match = self._find_dangerous(command)
+        if match:
             # Validate kill commands specifically
-            if any(
-                kill_cmd in command.lower()
-                for kill_cmd in ["kill", "killall", "pkill", "systemctl stop"]
-            ):
-                is_safe, error, process_info = self.validate_kill_command(command)
+            if match.lastgroup == "kill":
+                is_safe, error, process_info = self._validate_kill_command(command)
 
                 if not is_safe:
                     return True, error
@@ -0,0 +1,166 @@
+"""Typer application with TerminalBot subcommands."""
+
+import typer
+from typing_extensions import Annotated
+
+# Create Typer app
+app = typer.Typer(
+    name="terminalbot",
+    help="AI-powered Linux troubleshooting assistant",
+    add_completion=True,
+)
+
+
+@app.command(name="init")
+def init():
+    """Initialize TerminalBot configuration."""
+    from ..config import get_config_path, get_settings
+    from .output import confirm_action, print_error, print_info, print_success, print_warning
+
+    config_path = get_config_path()
+
+    if config_path.exists():
+        print_warning(f"Configuration already exists at: {config_path}")
+        if not confirm_action("Overwrite existing configuration?"):
+            print_info("Configuration unchanged")
+            return
+
+    try:
+        # Load default settings
+        settings = get_settings()
+
+        # Save to config file
+        settings.save_to_yaml(config_path)
+
+        print_success(f"Configuration initialized at: {config_path}")
+        print_info("\nNext steps:")
+        print_info("1. Edit the config file to set your API keys (if using cloud LLM)")
+        print_info("2. Or copy .env.example to .env and set environment variables")
+        print_info("3. Try a query: terminalbot 'check system status'")
+
+    except Exception as e:
+        print_error(f"Failed to initialize configuration: {e}")
+        raise typer.Exit(code=1)
+
+
+# Config subcommand group
+config_app = typer.Typer(name="config", help="Manage configuration settings")
+app.add_typer(config_app)
+
+
+@config_app.command(name="show")
+def config_show():
+    """Show current configuration."""
+    from ..config import get_config_path
+    from .output import print_error, print_info
+
+    try:
+        config_path = get_config_path()
+        if not config_path.exists():
+            print_error("Configuration not initialized. Run: terminalbot init")
+            return
+
+        with open(config_path) as f:
+            content = f.read()
+
+        print_info(f"Configuration file: {config_path}\n")
+        typer.echo(content)
+
+    except Exception as e:
+        print_error(f"Failed to show configuration: {e}")
+        raise typer.Exit(code=1)
+
+
+@config_app.command(name="set")
+def config_set(
+    key: Annotated[str, typer.Argument(help="Configuration key (e.g., llm.primary)")],
+    value: Annotated[str, typer.Argument(help="Configuration value")],
+):
+    """Set a configuration value."""
+    from ..config import Settings, get_config_path
+    from .output import print_error, print_success
+
+    try:
+        config_path = get_config_path()
+
+        # Update just this key in the file
+        Settings.patch_yaml(config_path, key, value)
+
+        print_success(f"Updated {key} = {value}")
+
+    except Exception as e:
+        print_error(f"Failed to update configuration: {e}")
+        raise typer.Exit(code=1)
+
+
+# Plugins subcommand group
+plugins_app = typer.Typer(name="plugins", help="Manage plugins")
+app.add_typer(plugins_app)
+
+
+@plugins_app.command(name="list")
+def plugins_list():
+    """List available plugins."""
+    from ..plugins import ProcessesPlugin, SystemPlugin
+    from .output import print_error, print_info
+
+    try:
+        # Plugins create their executor/safety validator lazily, so listing
+        # them doesn't need either
+        available_plugins = [SystemPlugin(), ProcessesPlugin()]
+
+        print_info("Available plugins:\n")
+        for plugin in available_plugins:
+            typer.echo(f"  • {plugin.name}: {plugin.description}")
+            typer.echo(f"    Tools: {len(plugin.get_tools())}")
+
+    except Exception as e:
+        print_error(f"Failed to list plugins: {e}")
+        raise typer.Exit(code=1)
+
+
+# Ollama subcommand group
+ollama_app = typer.Typer(name="ollama", help="Manage the local Ollama model")
+app.add_typer(ollama_app)
+
+
+@ollama_app.command(name="pull")
+def ollama_pull():
+    """Download the configured Ollama model."""
+    from ..config import get_settings
+    from ..llm.ollama_provider import OllamaProvider
+    from .output import print_error, print_success, show_spinner
+
+    config = get_settings().llm.ollama
+    provider = OllamaProvider(model=config.model, base_url=config.base_url, timeout=config.timeout)
+
+    try:
+        with show_spinner(f"Pulling {config.model}..."):
+            provider.ensure_model()
+        print_success(f"Model {config.model} is ready")
+
+    except Exception as e:
+        print_error(f"Failed to pull {config.model}: {e}")
+        raise typer.Exit(code=1)
+    finally:
+        provider.close()
+
+
+@app.command(name="capabilities")
+def capabilities():
+    """Show all available capabilities."""
+    from ..agent.coordinator import AgentCoordinator
+    from ..llm import get_llm_provider
+    from ..plugins import ProcessesPlugin, SystemPlugin
+    from .output import print_capabilities, print_error
+
+    try:
+        # No coordinator or executor needed just to describe what's available
+        caps = AgentCoordinator.list_capabilities_static(
+            [SystemPlugin(), ProcessesPlugin()], get_llm_provider()
+        )
+        print_capabilities(caps)
+
+    except Exception as e:
+        print_error(f"Failed to show capabilities: {e}")
+        raise typer.Exit(code=1)
@@ -1,31 +1,13 @@
-"""Main CLI interface using Typer."""
+"""Main CLI entry point.
+
+Free-form queries are handled here directly; subcommands are dispatched to
+the Typer app in cli/app.py, which is only imported when needed.
+"""
 
 import logging
 import sys
-from typing import Optional
-
-import typer
-from typing_extensions import Annotated
-
-from ..agent.coordinator import AgentCoordinator
-from ..agent.safety import SafetyValidator
-from ..config import get_config_path, get_settings
-from ..executor import CommandExecutor
-from ..plugins import ProcessesPlugin, SystemPlugin
-from .output import (
-    confirm_action,
-    print_banner,
-    print_capabilities,
-    print_command,
-    print_command_output,
-    print_error,
-    print_info,
-    print_response,
-    print_success,
-    print_suggestions,
-    print_warning,
-    show_spinner,
-)
+
+from .. import __version__
 
 # Configure logging
 logging.basicConfig(
@@ -35,12 +17,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create Typer app
-app = typer.Typer(
-    name="terminalbot",
-    help="AI-powered Linux troubleshooting assistant",
-    add_completion=True,
-)
+# Known subcommands (defined in cli/app.py)
+SUBCOMMANDS = {"init", "config", "plugins", "ollama", "capabilities"}
+
+# Printed for no-args/--help without importing Typer
+HELP_TEXT = """Usage: terminalbot [OPTIONS] QUERY...
+       terminalbot COMMAND [ARGS]...
+
+AI-powered Linux troubleshooting assistant
+
+Options:
+  --lite         Rule-based mode only (no LLM)
+  --force-llm    Use the LLM even if a rule matches
+  --dry-run      Show the command without executing it
+  -v, --verbose  Enable debug logging
+  -V, --version  Show version and exit
+  -h, --help     Show this message and exit
+
+Commands:
+  init          Initialize TerminalBot configuration
+  config        Manage configuration settings
+  plugins       Manage plugins
+  ollama        Manage the local Ollama model
+  capabilities  Show all available capabilities
+
+Run 'terminalbot COMMAND --help' for help on a command.
+"""
+
+
+def __getattr__(name: str):
+    """Expose the Typer app lazily (importing Typer is comparatively slow)."""
+    if name == "app":
+        from .app import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run_app() -> None:
+    """Hand the command line over to the Typer app."""
+    from .app import app
+
+    app()
 
 
 def process_query(query: str, lite: bool = False, force_llm: bool = False, dry_run: bool = False):
@@ -53,6 +71,25 @@ def process_query(query: str, lite: bool = False, force_llm: bool = False, dry_r
         force_llm: Force LLM usage
         dry_run: Don't execute commands
     """
+    # Imported here so `--help` and other subcommands stay fast to start
+    from ..agent.coordinator import AgentCoordinator
+    from ..agent.safety import SafetyValidator
+    from ..config import get_settings
+    from ..executor import CommandExecutor
+    from ..plugins import ProcessesPlugin, SystemPlugin
+    from .output import (
+        confirm_action,
+        print_command,
+        print_command_output,
+        print_error,
+        print_info,
+        print_response,
+        print_suggestions,
+        print_warning,
+        show_spinner,
+        stream_response,
+    )
+
     try:
         # Load settings
         settings = get_settings()
@@ -74,20 +111,25 @@ def process_query(query: str, lite: bool = False, force_llm: bool = False, dry_r
         # Initialize coordinator
         coordinator = AgentCoordinator(plugins, settings=settings)
 
+        # Load the LLM provider while the query is matched and run
+        if not settings.llm.enable_lite_mode:
+            coordinator.warm_llm_provider()
+
         # Process query
         with show_spinner("Analyzing query..."):
             result = coordinator.process_query(query, force_llm=force_llm)
 
         # Handle result based on mode
-        if not result["success"]:
-            print_error(result.get("error", "Unknown error"))
-            if "suggestions" in result and result["suggestions"]:
-                print_suggestions(result["suggestions"])
+        if not result.success:
+            print_error(result.error or "Unknown error")
+            if result.suggestions:
+                print_suggestions(result.suggestions)
             return
 
         # Rule-based mode - execute command
-        if result["mode"] == "rule-based":
-            command = result["command"]
+        if result.mode == "rule-based":
+            command = result.command
+            assert command is not None  # successful rule-based results carry a command
 
             # Safety check
             requires_confirm, reason = safety.requires_confirmation(command)
@@ -121,152 +163,23 @@ def process_query(query: str, lite: bool = False, force_llm: bool = False, dry_r
                 print_command_output(cmd_result.stderr)
 
             # Analyze results with LLM if available
+            # (streamed so the first tokens show up while the rest generate)
             if coordinator.llm_provider and not lite:
-                with show_spinner("Analyzing results..."):
-                    analysis = coordinator.analyze_results(query, cmd_result.output)
-                if analysis != cmd_result.output:  # Only show if LLM provided analysis
-                    print_response(analysis)
+                with stream_response() as write:
+                    coordinator.analyze_results(query, cmd_result.output, callback=write)
 
         # LLM mode - show response
-        elif result["mode"] == "llm":
-            print_response(result["response"])
+        elif result.mode == "llm":
+            assert result.response is not None  # successful LLM results carry a response
+            print_response(result.response)
 
     except KeyboardInterrupt:
         print_info("\nOperation cancelled by user")
-        raise typer.Exit(code=0)
+        sys.exit(0)
     except Exception as e:
         logger.error(f"Error processing query: {e}", exc_info=True)
         print_error(f"Failed to process query: {e}")
-        raise typer.Exit(code=1)
-
-
-@app.command(name="init")
-def init():
-    """Initialize TerminalBot configuration."""
-    config_path = get_config_path()
-
-    if config_path.exists():
-        print_warning(f"Configuration already exists at: {config_path}")
-        if not confirm_action("Overwrite existing configuration?"):
-            print_info("Configuration unchanged")
-            return
-
-    try:
-        # Load default settings
-        settings = get_settings()
-
-        # Save to config file
-        settings.save_to_yaml(config_path)
-
-        print_success(f"Configuration initialized at: {config_path}")
-        print_info("\nNext steps:")
-        print_info("1. Edit the config file to set your API keys (if using cloud LLM)")
-        print_info("2. Or copy .env.example to .env and set environment variables")
-        print_info("3. Try a query: terminalbot 'check system status'")
-
-    except Exception as e:
-        print_error(f"Failed to initialize configuration: {e}")
-        raise typer.Exit(code=1)
-
-
-# Config subcommand group
-config_app = typer.Typer(name="config", help="Manage configuration settings")
-app.add_typer(config_app)
-
-
-@config_app.command(name="show")
-def config_show():
-    """Show current configuration."""
-    try:
-        config_path = get_config_path()
-        if not config_path.exists():
-            print_error("Configuration not initialized. Run: terminalbot init")
-            return
-
-        with open(config_path) as f:
-            content = f.read()
-
-        print_info(f"Configuration file: {config_path}\n")
-        typer.echo(content)
-
-    except Exception as e:
-        print_error(f"Failed to show configuration: {e}")
-        raise typer.Exit(code=1)
-
-
-@config_app.command(name="set")
-def config_set(
-    key: Annotated[str, typer.Argument(help="Configuration key (e.g., llm.primary)")],
-    value: Annotated[str, typer.Argument(help="Configuration value")],
-):
-    """Set a configuration value."""
-    try:
-        config_path = get_config_path()
-        settings = get_settings()
-
-        # Update setting
-        settings.update_setting(key, value)
-
-        # Save to file
-        settings.save_to_yaml(config_path)
-
-        print_success(f"Updated {key} = {value}")
-
-    except Exception as e:
-        print_error(f"Failed to update configuration: {e}")
-        raise typer.Exit(code=1)
-
-
-# Plugins subcommand group
-plugins_app = typer.Typer(name="plugins", help="Manage plugins")
-app.add_typer(plugins_app)
-
-
-@plugins_app.command(name="list")
-def plugins_list():
-    """List available plugins."""
-    try:
-        # Initialize plugins
-        executor = CommandExecutor()
-        safety = SafetyValidator()
-
-        available_plugins = [
-            SystemPlugin(executor),
-            ProcessesPlugin(executor, safety),
-        ]
-
-        print_info("Available plugins:\n")
-        for plugin in available_plugins:
-            typer.echo(f"  • {plugin.name}: {plugin.description}")
-            typer.echo(f"    Tools: {len(plugin.get_tools())}")
-
-    except Exception as e:
-        print_error(f"Failed to list plugins: {e}")
-        raise typer.Exit(code=1)
-
-
-@app.command(name="capabilities")
-def capabilities():
-    """Show all available capabilities."""
-    try:
-        # Initialize components
-        executor = CommandExecutor()
-        safety = SafetyValidator()
-
-        plugins = [
-            SystemPlugin(executor),
-            ProcessesPlugin(executor, safety),
-        ]
-
-        coordinator = AgentCoordinator(plugins)
-
-        # Get and display capabilities
-        caps = coordinator.list_capabilities()
-        print_capabilities(caps)
-
-    except Exception as e:
-        print_error(f"Failed to show capabilities: {e}")
-        raise typer.Exit(code=1)
+        sys.exit(1)
 
 
 def cli():
@@ -275,15 +188,15 @@ def cli():
 
     Handles routing between direct queries and subcommands.
     """
-    # Check if first arg is a known subcommand
-    known_commands = {"init", "config", "plugins", "capabilities"}
-
     # Get args (skip program name)
     args = sys.argv[1:]
 
-    # If no args, show help
+    # Fast path: answer help/version without importing Typer
     if not args or args[0] in ["--help", "-h"]:
-        app()
+        sys.stdout.write(HELP_TEXT)
+        return
+    if args[0] in ["--version", "-V"]:
+        sys.stdout.write(f"terminalbot {__version__}\n")
         return
 
     # Check if first non-option arg is a subcommand
@@ -294,8 +207,8 @@ def cli():
             break
 
     # If it's a known subcommand, let Typer handle it
-    if first_arg in known_commands:
-        app()
+    if first_arg in SUBCOMMANDS:
+        run_app()
         return
 
     # Otherwise, treat everything as a query
@@ -315,7 +228,7 @@ def cli():
     ]
 
     if not query_args:
-        app()
+        sys.stdout.write(HELP_TEXT)
         return
 
     query_text = " ".join(query_args)
@@ -1,9 +1,11 @@
 """Rich output formatting for terminal."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
@@ -13,38 +15,54 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 
+_BANNER = (
+    "[bold blue]╔══════════════════════════════════════╗[/bold blue]\n"
+    "[bold blue]║[/bold blue]  [bold white]🤖 TerminalBot[/bold white] [dim]- AI Troubleshooting[/dim]  [bold blue]║[/bold blue]\n"
+    "[bold blue]╚══════════════════════════════════════╝[/bold blue]\n"
+)
+
+
 def print_banner():
     """Print TerminalBot banner."""
-    console.print(
-        "[bold blue]╔══════════════════════════════════════╗[/bold blue]"
-    )
-    console.print(
-        "[bold blue]║[/bold blue]  [bold white]🤖 TerminalBot[/bold white] [dim]- AI Troubleshooting[/dim]  [bold blue]║[/bold blue]"
-    )
-    console.print(
-        "[bold blue]╚══════════════════════════════════════╝[/bold blue]"
-    )
-    console.print()
+    console.print(_BANNER, highlight=False)
+
+
+# Status prefixes as (rich markup, pre-rendered ANSI). On a color terminal the
+# ANSI form is written directly, skipping markup parsing for every line.
+_ERROR_PREFIX = ("[bold red]✗ Error:[/bold red]", "\x1b[1;31m✗ Error:\x1b[0m")
+_SUCCESS_PREFIX = ("[bold green]✓[/bold green]", "\x1b[1;32m✓\x1b[0m")
+_INFO_PREFIX = ("[bold blue]ℹ[/bold blue]", "\x1b[1;34mℹ\x1b[0m")
+_WARNING_PREFIX = ("[bold yellow]⚠[/bold yellow]", "\x1b[1;33m⚠\x1b[0m")
+
+
+def _print_status(prefix: Tuple[str, str], message: str):
+    """Print a status line with a styled prefix."""
+    markup, ansi = prefix
+    if console.is_terminal and console.color_system is not None:
+        console.file.write(f"{ansi} {message}\n")
+        console.file.flush()
+    else:
+        console.print(f"{markup} {escape(message)}")
 
 
 def print_error(message: str):
     """Print error message."""
-    console.print(f"[bold red]✗ Error:[/bold red] {message}")
+    _print_status(_ERROR_PREFIX, message)
 
 
 def print_success(message: str):
     """Print success message."""
-    console.print(f"[bold green]✓[/bold green] {message}")
+    _print_status(_SUCCESS_PREFIX, message)
 
 
 def print_info(message: str):
     """Print info message."""
-    console.print(f"[bold blue]ℹ[/bold blue] {message}")
+    _print_status(_INFO_PREFIX, message)
 
 
 def print_warning(message: str):
     """Print warning message."""
-    console.print(f"[bold yellow]⚠[/bold yellow] {message}")
+    _print_status(_WARNING_PREFIX, message)
 
 
 def print_command(command: str):
@@ -65,24 +83,62 @@ def print_command_output(output: str, truncate: bool = True, max_lines: int = 50
         console.print("[dim]<no output>[/dim]")
         return
 
-    lines = output.split("\n")
-
-    if truncate and len(lines) > max_lines:
+    # Count first; only split output that actually needs truncating
+    if truncate and output.count("\n") >= max_lines:
+        lines = output.split("\n")
         # Show first portion and last portion
         shown_lines = lines[:max_lines // 2] + ["...", f"({len(lines) - max_lines} lines hidden)", "..."] + lines[-max_lines // 2:]
         output = "\n".join(shown_lines)
 
-    console.print(Panel(output, border_style="dim", padding=(0, 1)))
+    # Plain Text: command output is not markup (e.g. "[1]" in dmesg)
+    console.print(Panel(Text(output), border_style="dim", padding=(0, 1)))
 
 
-def print_response(response: str):
-    """Print LLM or bot response."""
-    console.print(Panel(
+def _response_panel(response: str) -> Panel:
+    """Build the panel used to display a response."""
+    return Panel(
         response,
         title="[bold blue]Response[/bold blue]",
         border_style="blue",
         padding=(1, 2),
-    ))
+    )
+
+
+def print_response(response: str):
+    """Print LLM or bot response."""
+    console.print(_response_panel(response))
+
+
+@contextmanager
+def stream_response() -> Iterator[Callable[[str], None]]:
+    """
+    Display a response panel that grows as chunks arrive.
+
+    Nothing is shown until the first chunk is written.
+
+    Yields:
+        Function to call with each new chunk of response text
+    """
+    from rich.live import Live
+
+    chunks: List[str] = []
+    live: Optional[Live] = None
+
+    def write(chunk: str) -> None:
+        nonlocal live
+        chunks.append(chunk)
+        panel = _response_panel("".join(chunks))
+        if live is None:
+            live = Live(panel, console=console)
+            live.start()
+        else:
+            live.update(panel)
+
+    try:
+        yield write
+    finally:
+        if live is not None:
+            live.stop()
 
 
 def print_process_table(processes: List[Dict[str, Any]]):
@@ -137,9 +193,10 @@ def print_capabilities(capabilities: List[str]):
     Args:
         capabilities: List of capability descriptions
     """
-    console.print("\n[bold cyan]Available Capabilities:[/bold cyan]\n")
-    for cap in capabilities:
-        console.print(cap)
+    console.print(
+        "\n[bold cyan]Available Capabilities:[/bold cyan]\n\n" + "\n".join(capabilities),
+        highlight=False,
+    )
 
 
 def confirm_action(message: str, default: bool = False) -> bool:
@@ -166,9 +223,15 @@ def show_spinner(message: str = "Processing..."):
     """
     Show a spinner with message.
 
+    When output isn't a terminal (e.g. piped), nothing is shown and no
+    refresh thread is started.
+
     Returns:
         Context manager for spinner
     """
+    if not console.is_terminal:
+        return nullcontext()
+
     from rich.spinner import Spinner
     from rich.live import Live
 
@@ -1,13 +1,113 @@
 """Configuration settings using Pydantic."""
 
+import copy
+import json
+import logging
 import os
+from collections import OrderedDict
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+logger = logging.getLogger(__name__)
+
+if not getattr(yaml, "__with_libyaml__", False):
+    logger.debug("libyaml not available - using the pure-Python YAML loader")
+
+
+# Parsed YAML files keyed by path, validated by (mtime_ns, size, inode)
+_YAML_CACHE_SIZE = 32
+_yaml_cache: "OrderedDict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]]" = OrderedDict()
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: YAML file to read
+
+    Returns:
+        Parsed mapping (a fresh copy the caller may mutate)
+    """
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        _yaml_cache.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=SafeLoader) or {}
+
+    _yaml_cache[path] = (signature, data)
+    _yaml_cache.move_to_end(path)
+    while len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def _load_defaults() -> Dict[str, Any]:
+    """
+    Load the packaged default configuration.
+
+    Prefers defaults.json (generated by scripts/build_defaults.py), which
+    parses much faster than YAML, unless defaults.yaml has been edited since.
+
+    Returns:
+        Default configuration mapping
+    """
+    config_dir = Path(__file__).parent
+    yaml_path = config_dir / "defaults.yaml"
+    json_path = config_dir / "defaults.json"
+
+    try:
+        if not yaml_path.exists() or json_path.stat().st_mtime_ns >= yaml_path.stat().st_mtime_ns:
+            with open(json_path) as f:
+                defaults: Dict[str, Any] = json.load(f)
+            return defaults
+    except (OSError, ValueError):
+        pass  # Missing or unreadable JSON - fall back to YAML
+
+    if yaml_path.exists():
+        return _load_yaml(yaml_path)
+
+    return {}
+
+
+@lru_cache(maxsize=32)
+def _env_var_name(value: str) -> Optional[str]:
+    """Return the variable name from an "env:NAME" reference, or None."""
+    if value.startswith("env:"):
+        return value[4:]
+    return None
+
+
+def _resolve_env(value: str) -> str:
+    """
+    Resolve an "env:NAME" reference to the variable's current value.
+
+    Only parsing the reference is memoized; the environment itself is read
+    on every call so rotated keys are picked up by the next settings load.
+    """
+    env_var = _env_var_name(value)
+    if env_var is None:
+        return value
+    return os.getenv(env_var, "")
+
 
 class OllamaConfig(BaseModel):
     """Ollama LLM configuration."""
@@ -15,6 +115,7 @@ class OllamaConfig(BaseModel):
     model: str = "llama3.2:1b"
     base_url: str = "http://localhost:11434"
     timeout: int = 10
+    embedding_model: str = "nomic-embed-text"
 
 
 class OpenAIConfig(BaseModel):
@@ -24,15 +125,13 @@ class OpenAIConfig(BaseModel):
     api_key: str = ""
     max_tokens: int = 2000
     temperature: float = 0.1
+    rpm: int = 0  # Requests per minute, 0 = unlimited
 
     @field_validator("api_key")
     @classmethod
     def resolve_env_vars(cls, v: str) -> str:
         """Resolve environment variable references."""
-        if v.startswith("env:"):
-            env_var = v[4:]
-            return os.getenv(env_var, "")
-        return v
+        return _resolve_env(v)
 
 
 class AnthropicConfig(BaseModel):
@@ -42,16 +141,15 @@ class AnthropicConfig(BaseModel):
     api_key: str = ""
     max_tokens: int = 2000
     temperature: float = 0.1
+    rpm: int = 0  # Requests per minute, 0 = unlimited
+    use_batch: bool = False
+    batch_timeout: int = 3600  # Seconds to wait for a message batch
 
     @field_validator("api_key")
-    
     @classmethod
     def resolve_env_vars(cls, v: str) -> str:
         """Resolve environment variable references."""
-        if v.startswith("env:"):
-            env_var = v[4:]
-            return os.getenv(env_var, "")
-        return v
+        return _resolve_env(v)
 
 
 class LLMConfig(BaseModel):
@@ -60,6 +158,7 @@ class LLMConfig(BaseModel):
     primary: Optional[str] = "ollama"
     fallback: Optional[str] = "openai"
     enable_lite_mode: bool = False
+    concurrency: int = 4  # Worker threads for blocking provider calls
     ollama: OllamaConfig = Field(default_factory=OllamaConfig)
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     anthropic: AnthropicConfig = Field(default_factory=AnthropicConfig)
@@ -129,6 +228,9 @@ class PerformanceConfig(BaseModel):
     """Performance tuning configuration."""
 
     cache_ttl: int = 3600  # 1 hour
+    disk_cache: bool = False
+    cache_dir: str = "~/.cache/terminalbot"
+    semantic_cache_threshold: float = 0.0  # 0 = disabled
     lazy_load_llm: bool = True
     async_execution: bool = True
 
@@ -154,16 +256,9 @@ class Settings(BaseSettings):
     def load_from_yaml(cls, config_path: Path) -> "Settings":
         """Load settings from YAML file."""
         if not config_path.exists():
-            # Load defaults from package
-            defaults_path = Path(__file__).parent / "defaults.yaml"
-            if defaults_path.exists():
-                with open(defaults_path) as f:
-                    config_data = yaml.safe_load(f)
-            else:
-                config_data = {}
+            config_data = _load_defaults()
         else:
-            with open(config_path) as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _load_yaml(config_path)
 
         return cls(**config_data)
 
@@ -174,7 +269,66 @@ class Settings(BaseSettings):
         # Convert to dict and dump to YAML
         config_dict = self.model_dump(mode="json")
         with open(config_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                config_dict, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+            )
+
+    @classmethod
+    def patch_yaml(cls, config_path: Path, key_path: str, value: Any) -> None:
+        """
+        Set one value in a YAML config file without loading full Settings.
+
+        Only the raw mapping is read and written back; no models are built.
+        The value is coerced to the setting's type, so "30" is stored as 30
+        for an int setting but stays "3.10" for a string one. Strings that
+        don't fit as-is (e.g., "[1, 2]" for a list) are parsed as YAML.
+
+        Args:
+            config_path: Config file to update (created from defaults if missing)
+            key_path: Setting in dot notation (e.g., 'llm.primary')
+            value: New value
+
+        Raises:
+            KeyError: If key_path does not name a known setting
+            ValueError: If value is not valid for the setting
+        """
+        keys = key_path.split(".")
+
+        # Check the key path against the model schema
+        model: Any = cls
+        for key in keys:
+            if not (isinstance(model, type) and issubclass(model, BaseModel)):
+                raise KeyError(f"Unknown setting: {key_path}")
+            field = model.model_fields.get(key)
+            if field is None:
+                raise KeyError(f"Unknown setting: {key_path}")
+            model = field.annotation
+
+        # model is now the setting's own type
+        adapter: TypeAdapter[Any] = TypeAdapter(model)
+        try:
+            value = adapter.validate_python(value)
+        except ValidationError:
+            if not isinstance(value, str):
+                raise
+            value = adapter.validate_python(yaml.load(value, Loader=SafeLoader))
+        value = adapter.dump_python(value, mode="json")
+
+        config_data = _load_yaml(config_path) if config_path.exists() else _load_defaults()
+
+        # Navigate to the parent mapping, creating sections as needed
+        node = config_data
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[keys[-1]] = value
+
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(config_path, "w") as f:
+            yaml.dump(
+                config_data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+            )
 
     def update_setting(self, key_path: str, value: Any) -> None:
         """Update a setting using dot notation (e.g., 'llm.primary')."""
@@ -209,13 +363,18 @@ def get_settings(config_path: Optional[Path] = None, reload: bool = False) -> Se
     if _settings is None or reload:
         if config_path is None:
             # Default config location
-            config_path = Path.home() / ".config" / "terminalbot" / "config.yaml"
+            config_path = get_config_path()
 
         _settings = Settings.load_from_yaml(config_path)
 
     return _settings
 
 
+@cache
 def get_config_path() -> Path:
-    """Get the default config file path."""
+    """
+    Get the default config file path.
+
+    Resolved once per process; the home directory doesn't change underneath us.
+    """
     return Path.home() / ".config" / "terminalbot" / "config.yaml"
@@ -1,5 +1,5 @@
 """Command execution engine."""
 
-from .command import CommandExecutor, CommandResult
+from .command import CommandExecutor, CommandResult, get_default_executor
 
-__all__ = ["CommandExecutor", "CommandResult"]
+__all__ = ["CommandExecutor", "CommandResult", "get_default_executor"]
@@ -1,20 +1,77 @@
 """Safe command execution with resource limits."""
 
 import asyncio
+import atexit
+import io
 import logging
 import os
+import selectors
+import shlex
 import subprocess
+import threading
+import time
+import uuid
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Dict, Optional, Set, Tuple
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Characters that need /bin/sh to interpret (pipes, redirects, expansion,
+# quoting, globbing, ...). Commands without any of them are spawned directly.
+_SHELL_CHARS = frozenset("|&;<>()$`\\\"'*?[]#~={}\n")
 
-@dataclass
+
+def _needs_shell(command: str) -> bool:
+    """Check whether a command must be run through the shell."""
+    return not command.strip() or any(c in _SHELL_CHARS for c in command)
+
+
+_READ_CHUNK = 65536
+
+
+class _CappedBuffer:
+    """
+    Collects a child's output up to a byte limit.
+
+    Bytes past the limit are read (so the child never blocks on a full pipe
+    or gets SIGPIPE) but discarded, keeping memory bounded by the limit.
+    """
+
+    __slots__ = ("data", "limit", "overflow")
+
+    def __init__(self, limit: int):
+        self.data = bytearray()
+        self.limit = limit
+        self.overflow = False
+
+    def feed(self, chunk: bytes) -> None:
+        room = self.limit - len(self.data)
+        if len(chunk) > room:
+            self.overflow = True
+            chunk = chunk[: max(room, 0)]
+        self.data += chunk
+
+    def text(self) -> str:
+        return self.data.decode("utf-8", errors="replace")
+
+
+async def _read_stream(stream: asyncio.StreamReader, buf: _CappedBuffer) -> None:
+    """Read an async stream to EOF into a capped buffer."""
+    while chunk := await stream.read(_READ_CHUNK):
+        buf.feed(chunk)
+
+
+def _read_pipe(pipe: io.BufferedReader, buf: _CappedBuffer) -> None:
+    """Read a pipe to EOF into a capped buffer (runs in a reader thread)."""
+    with pipe:
+        while chunk := pipe.read1(_READ_CHUNK):
+            buf.feed(chunk)
+
+
+@dataclass(slots=True)
 class CommandResult:
     """Result of command execution."""
 
@@ -53,6 +110,11 @@ class CommandExecutor:
         """Initialize executor with settings."""
         self.settings = settings or get_settings()
         self.history_file = Path(self.settings.logging.history_file).expanduser()
+        self._history_fh: Optional[IO[bytes]] = None
+        self._history_lock = threading.Lock()
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lock = threading.Lock()
+        self._atexit_registered = False
         self._ensure_history_file()
 
     def _ensure_history_file(self) -> None:
@@ -63,18 +125,202 @@ class CommandExecutor:
                 self.history_file.touch()
 
     def _log_command(self, command: str, result: CommandResult) -> None:
-        """Log command to history file."""
+        """
+        Log command to history file.
+
+        Writes go to a buffered handle that stays open for the lifetime of the
+        executor; it is flushed by close() or at interpreter exit.
+        """
         if not self.settings.logging.log_commands:
             return
 
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        status = "SUCCESS" if result.success else "FAILED"
+        line = f"{timestamp} | {status} | {command}\n".encode("utf-8", errors="replace")
+
         try:
-            with open(self.history_file, "a") as f:
-                timestamp = datetime.now().isoformat()
-                status = "SUCCESS" if result.success else "FAILED"
-                f.write(f"{timestamp} | {status} | {command}\n")
+            with self._history_lock:
+                if self._history_fh is None:
+                    self._history_fh = open(self.history_file, "ab", buffering=8192)
+                    self._register_atexit()
+                self._history_fh.write(line)
         except Exception as e:
             logger.warning(f"Failed to log command history: {e}")
 
+    def _register_atexit(self) -> None:
+        """Have close() run at interpreter exit (once, however often it's requested)."""
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Flush and close the history file handle and stop the shell worker."""
+        with self._history_lock:
+            if self._history_fh is not None:
+                self._history_fh.close()
+                self._history_fh = None
+
+        self._discard_shell(graceful=True)
+        atexit.unregister(self.close)
+        self._atexit_registered = False
+
+    def _resolve_options(self, timeout: Optional[int], cwd: Optional[str]) -> Tuple[int, str]:
+        """Fill in the configured timeout and working directory."""
+        # Use config timeout if not specified
+        if timeout is None:
+            timeout = self.settings.execution.command_timeout
+
+        # Determine working directory
+        if cwd is None:
+            cwd = self.settings.execution.working_directory or os.getcwd()
+
+        return timeout, cwd
+
+    def _dry_run_result(self, command: str, cwd: str) -> CommandResult:
+        """Build the result returned instead of executing in dry-run mode."""
+        logger.info("DRY RUN - Command not executed")
+        return CommandResult(
+            command=command,
+            returncode=0,
+            stdout="[DRY RUN] Command would be executed",
+            stderr="",
+            execution_time=0.0,
+            working_directory=cwd,
+        )
+
+    def _limit_output(self, stdout: str, stderr: str) -> Tuple[str, str, bool]:
+        """
+        Enforce the output size limit.
+
+        Returns:
+            Tuple of (stdout, stderr, truncated)
+        """
+        max_size = self.settings.execution.max_output_size
+        total_output_size = len(stdout) + len(stderr)
+
+        if total_output_size <= max_size:
+            return stdout, stderr, False
+
+        logger.warning(f"Output truncated: {total_output_size} > {max_size} bytes")
+
+        # Truncate proportionally
+        stdout_limit = int(max_size * len(stdout) / total_output_size)
+        stderr_limit = max_size - stdout_limit
+
+        stdout = stdout[:stdout_limit] + "\n[... OUTPUT TRUNCATED ...]"
+        stderr = stderr[:stderr_limit] + "\n[... OUTPUT TRUNCATED ...]"
+
+        return stdout, stderr, True
+
+    async def _spawn(self, command: str, cwd: str) -> asyncio.subprocess.Process:
+        """
+        Start a command, skipping the shell when it isn't needed.
+
+        The child gets its own session so a timeout can kill the whole
+        process group (start_new_session keeps posix_spawn usable, unlike
+        preexec_fn).
+        """
+        if not _needs_shell(command):
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *shlex.split(command),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=cwd,
+                    start_new_session=os.name != "nt",
+                )
+            except (FileNotFoundError, PermissionError):
+                # Shell builtins and unknown commands: let sh report them
+                pass
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=os.name != "nt",
+        )
+
+    def _popen(self, command: str, cwd: str) -> subprocess.Popen:
+        """Blocking counterpart of _spawn()."""
+        if not _needs_shell(command):
+            try:
+                return subprocess.Popen(
+                    shlex.split(command),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    cwd=cwd,
+                    start_new_session=os.name != "nt",
+                )
+            except (FileNotFoundError, PermissionError):
+                pass
+
+        return subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=os.name != "nt",
+        )
+
+    def _new_buffers(self) -> Tuple[_CappedBuffer, _CappedBuffer]:
+        """Create stdout/stderr buffers for one command."""
+        # One byte over the limit, so an overflowing stream always exceeds
+        # max_output_size and gets the truncation marker from _limit_output
+        limit = self.settings.execution.max_output_size + 1
+        return _CappedBuffer(limit), _CappedBuffer(limit)
+
+    @staticmethod
+    def _kill(process) -> None:
+        """Kill a timed-out process and its children."""
+        try:
+            if os.name != "nt":
+                # Kill entire process group on Unix
+                os.killpg(os.getpgid(process.pid), 9)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass  # Process already terminated
+
+    def _build_result(
+        self,
+        command: str,
+        cwd: str,
+        returncode: Optional[int],
+        stdout_buf: _CappedBuffer,
+        stderr_buf: _CappedBuffer,
+        timed_out: bool,
+        start_time: float,
+    ) -> CommandResult:
+        """Decode and size-limit captured output into a CommandResult."""
+        stdout, stderr, truncated = self._limit_output(stdout_buf.text(), stderr_buf.text())
+
+        return CommandResult(
+            command=command,
+            returncode=returncode or (124 if timed_out else 0),
+            stdout=stdout,
+            stderr=stderr,
+            execution_time=time.monotonic() - start_time,
+            timed_out=timed_out,
+            truncated=truncated or stdout_buf.overflow or stderr_buf.overflow,
+            working_directory=cwd,
+        )
+
+    def _error_result(
+        self, command: str, cwd: str, error: Exception, start_time: float
+    ) -> CommandResult:
+        """Build the result for a command that could not be run."""
+        logger.error(f"Command execution failed: {error}", exc_info=True)
+        return CommandResult(
+            command=command,
+            returncode=1,
+            stdout="",
+            stderr=f"Execution error: {str(error)}",
+            execution_time=time.monotonic() - start_time,
+            working_directory=cwd,
+        )
+
     async def execute(
         self,
         command: str,
@@ -93,127 +339,53 @@ class CommandExecutor:
 
         Returns:
             CommandResult with execution details
-
-        Raises:
-            asyncio.TimeoutError: If command exceeds timeout
         """
-        # Use config timeout if not specified
-        if timeout is None:
-            timeout = self.settings.execution.command_timeout
-
-        # Determine working directory
-        if cwd is None:
-            cwd = self.settings.execution.working_directory or os.getcwd()
+        timeout, cwd = self._resolve_options(timeout, cwd)
 
         logger.info(f"Executing command: {command} (cwd: {cwd})")
 
         # Dry run mode
         if dry_run:
-            logger.info("DRY RUN - Command not executed")
-            return CommandResult(
-                command=command,
-                returncode=0,
-                stdout="[DRY RUN] Command would be executed",
-                stderr="",
-                execution_time=0.0,
-                working_directory=cwd,
-            )
+            return self._dry_run_result(command, cwd)
 
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         timed_out = False
-        truncated = False
 
         try:
-            # Create subprocess
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=cwd,
-                # Prevent command from spawning background processes
-                preexec_fn=os.setsid if os.name != "nt" else None,
-            )
-
-            # Wait for completion with timeout
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
-                )
-            except asyncio.TimeoutError:
+            process = await self._spawn(command, cwd)
+            stdout_buf, stderr_buf = self._new_buffers()
+            assert process.stdout is not None and process.stderr is not None
+
+            # Read both streams while waiting, with the overall timeout
+            tasks = [
+                asyncio.ensure_future(_read_stream(process.stdout, stdout_buf)),
+                asyncio.ensure_future(_read_stream(process.stderr, stderr_buf)),
+                asyncio.ensure_future(process.wait()),
+            ]
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+            if pending:
                 logger.warning(f"Command timed out after {timeout}s: {command}")
                 timed_out = True
+                self._kill(process)
 
-                # Kill the process and its children
-                try:
-                    if os.name != "nt":
-                        # Kill entire process group on Unix
-                        os.killpg(os.getpgid(process.pid), 9)
-                    else:
-                        process.kill()
-                except ProcessLookupError:
-                    pass  # Process already terminated
-
-                # Get whatever output was captured
-                try:
-                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                        process.communicate(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    stdout_bytes = b""
-                    stderr_bytes = b"Command timed out and was terminated"
-
-            # Decode output with error handling
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
-
-            # Enforce output size limit
-            max_size = self.settings.execution.max_output_size
-            total_output_size = len(stdout) + len(stderr)
-
-            if total_output_size > max_size:
-                logger.warning(f"Output truncated: {total_output_size} > {max_size} bytes")
-                truncated = True
-
-                # Truncate proportionally
-                stdout_limit = int(max_size * len(stdout) / total_output_size)
-                stderr_limit = max_size - stdout_limit
-
-                stdout = stdout[:stdout_limit] + "\n[... OUTPUT TRUNCATED ...]"
-                stderr = stderr[:stderr_limit] + "\n[... OUTPUT TRUNCATED ...]"
-
-            execution_time = asyncio.get_event_loop().time() - start_time
-
-            result = CommandResult(
-                command=command,
-                returncode=process.returncode or (124 if timed_out else 0),
-                stdout=stdout,
-                stderr=stderr,
-                execution_time=execution_time,
-                timed_out=timed_out,
-                truncated=truncated,
-                working_directory=cwd,
-            )
-
-            # Log to history
-            self._log_command(command, result)
+                # Collect whatever output is still buffered in the pipes
+                _, pending = await asyncio.wait(pending, timeout=1.0)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    stderr_buf.feed(b"Command timed out and was terminated")
 
-            return result
+            result = self._build_result(
+                command, cwd, process.returncode, stdout_buf, stderr_buf, timed_out, start_time
+            )
 
         except Exception as e:
-            logger.error(f"Command execution failed: {e}", exc_info=True)
-            execution_time = asyncio.get_event_loop().time() - start_time
-
-            result = CommandResult(
-                command=command,
-                returncode=1,
-                stdout="",
-                stderr=f"Execution error: {str(e)}",
-                execution_time=execution_time,
-                working_directory=cwd,
-            )
+            result = self._error_result(command, cwd, e, start_time)
 
-            self._log_command(command, result)
-            return result
+        # Log to history
+        self._log_command(command, result)
+        return result
 
     def execute_sync(
         self,
@@ -221,10 +393,231 @@ class CommandExecutor:
         timeout: Optional[int] = None,
         cwd: Optional[str] = None,
         dry_run: bool = False,
+        fast_path: bool = False,
     ) -> CommandResult:
         """
-        Synchronous wrapper for execute().
+        Synchronous counterpart of execute().
+
+        Use this when you can't use async/await. Runs the command with a
+        plain blocking subprocess, so no event loop is created per call.
+
+        With fast_path, the command is sent to a persistent shell instead of
+        a new subprocess. Only use it for simple, trusted, non-interactive
+        commands with small output: they run in a shared shell (state such
+        as cd or exported variables would carry over) with stdin closed.
+        """
+        timeout, cwd = self._resolve_options(timeout, cwd)
+
+        logger.info(f"Executing command: {command} (cwd: {cwd})")
+
+        if dry_run:
+            return self._dry_run_result(command, cwd)
+
+        # The shell runs one command at a time; concurrent callers don't wait
+        if fast_path and os.name != "nt" and self._shell_lock.acquire(blocking=False):
+            try:
+                result = self._execute_in_shell(command, timeout, cwd)
+            finally:
+                self._shell_lock.release()
+            self._log_command(command, result)
+            return result
+
+        return self._execute_blocking(command, timeout, cwd)
+
+    def _shell_worker(self) -> subprocess.Popen:
+        """Start (or restart) the persistent shell used by fast-path commands."""
+        if self._shell is None or self._shell.poll() is not None:
+            self._shell = subprocess.Popen(
+                ["/bin/sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+            self._register_atexit()
+        return self._shell
+
+    def _discard_shell(self, graceful: bool = False) -> None:
+        """Stop the persistent shell (if any); the next fast-path command starts a new one."""
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+
+        # Always set: the shell is started with all three pipes
+        assert shell.stdin is not None
+        assert shell.stdout is not None and shell.stderr is not None
+
+        if graceful and shell.poll() is None:
+            try:
+                # The shell exits at end of input
+                shell.stdin.close()
+                shell.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        if shell.poll() is None:
+            self._kill(shell)
+            shell.wait()
+
+        for pipe in (shell.stdin, shell.stdout, shell.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def _execute_in_shell(self, command: str, timeout: int, cwd: str) -> CommandResult:
+        """
+        Execute a command in the persistent shell.
+
+        After the command, the shell prints a unique marker and the exit
+        status on stdout and the marker on stderr; output is read up to them.
+        On timeout the shell is killed and restarted by the next command.
+
+        Args:
+            command: Command to execute
+            timeout: Timeout in seconds
+            cwd: Working directory
+
+        Returns:
+            CommandResult with execution details
+        """
+        start_time = time.monotonic()
+        marker = f"__terminalbot_done_{uuid.uuid4().hex}__"
+        script = (
+            f"cd {shlex.quote(cwd)} && {{ {command}\n}} </dev/null; "
+            f"printf '%s %d\\n' {marker} $?; printf '%s\\n' {marker} >&2\n"
+        )
+        marker_bytes = marker.encode()
+
+        try:
+            shell = self._shell_worker()
+            assert shell.stdin is not None
+            assert shell.stdout is not None and shell.stderr is not None
+            shell.stdin.write(script.encode())
+            shell.stdin.flush()
+
+            out_fd, err_fd = shell.stdout.fileno(), shell.stderr.fileno()
+            data = {out_fd: bytearray(), err_fd: bytearray()}
+            ends: Dict[int, int] = {}  # Marker position, once seen
+            finished: Set[int] = set()
+            timed_out = False
+            deadline = start_time + timeout
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(out_fd, selectors.EVENT_READ)
+                selector.register(err_fd, selectors.EVENT_READ)
+
+                while len(finished) < 2:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, _READ_CHUNK)
+                        if not chunk:
+                            raise RuntimeError("Shell worker exited")
+
+                        buf = data[key.fd]
+                        start = max(len(buf) - len(marker_bytes), 0)
+                        buf += chunk
+                        if key.fd not in ends:
+                            pos = buf.find(marker_bytes, start)
+                            if pos >= 0:
+                                ends[key.fd] = pos
+
+                        # The marker line is complete once it ends in a newline
+                        if key.fd in ends and buf.endswith(b"\n"):
+                            selector.unregister(key.fd)
+                            finished.add(key.fd)
+
+            stdout_buf, stderr_buf = self._new_buffers()
+            stdout_buf.feed(bytes(data[out_fd][: ends.get(out_fd, len(data[out_fd]))]))
+            stderr_buf.feed(bytes(data[err_fd][: ends.get(err_fd, len(data[err_fd]))]))
+
+            returncode = None
+            if timed_out:
+                logger.warning(f"Command timed out after {timeout}s: {command}")
+                self._discard_shell()
+                stderr_buf.feed(b"Command timed out and was terminated")
+            else:
+                returncode = int(data[out_fd][ends[out_fd] + len(marker_bytes) :].split()[0])
+
+            return self._build_result(
+                command, cwd, returncode, stdout_buf, stderr_buf, timed_out, start_time
+            )
+
+        except Exception as e:
+            # The shell's state is unknown now; start a fresh one next time
+            self._discard_shell()
+            return self._error_result(command, cwd, e, start_time)
+
+    def _execute_blocking(self, command: str, timeout: int, cwd: str) -> CommandResult:
+        """
+        Execute a command with a blocking subprocess and resource limits.
+
+        Args:
+            command: Command to execute
+            timeout: Timeout in seconds
+            cwd: Working directory
 
-        Use this when you can't use async/await.
+        Returns:
+            CommandResult with execution details
         """
-        return asyncio.run(self.execute(command, timeout, cwd, dry_run))
+        start_time = time.monotonic()
+        timed_out = False
+
+        try:
+            process = self._popen(command, cwd)
+            stdout_buf, stderr_buf = self._new_buffers()
+
+            readers = [
+                threading.Thread(target=_read_pipe, args=(process.stdout, stdout_buf), daemon=True),
+                threading.Thread(target=_read_pipe, args=(process.stderr, stderr_buf), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Command timed out after {timeout}s: {command}")
+                timed_out = True
+                self._kill(process)
+                process.wait()
+
+            # Collect whatever output is still buffered in the pipes
+            deadline = time.monotonic() + (1.0 if timed_out else timeout)
+            for reader in readers:
+                reader.join(max(deadline - time.monotonic(), 0))
+            if timed_out and any(reader.is_alive() for reader in readers):
+                stderr_buf.feed(b"Command timed out and was terminated")
+
+            result = self._build_result(
+                command, cwd, process.returncode, stdout_buf, stderr_buf, timed_out, start_time
+            )
+
+        except Exception as e:
+            result = self._error_result(command, cwd, e, start_time)
+
+        self._log_command(command, result)
+        return result
+
+
+# Shared executor for components not given one (lazy loaded)
+_default_executor: Optional[CommandExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> CommandExecutor:
+    """
+    Get or create the process-wide command executor (thread-safe).
+
+    Plugins created without an executor share this one, so they share one
+    history file handle and one set of settings.
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_executor_lock:
+            if _default_executor is None:
+                _default_executor = CommandExecutor()
+    return _default_executor
@@ -1,6 +1,29 @@
 """LLM provider interface and implementations."""
 
-from .base import BaseLLMProvider
-from .factory import get_llm_provider
+from typing import TYPE_CHECKING
 
-__all__ = ["BaseLLMProvider", "get_llm_provider"]
+if TYPE_CHECKING:
+    from .base import BaseLLMProvider, LLMResult
+    from .factory import get_llm_provider
+
+__all__ = ["BaseLLMProvider", "LLMResult", "get_llm_provider"]
+
+# Public name -> submodule defining it, imported on first access
+_LAZY_IMPORTS = {
+    "BaseLLMProvider": ".base",
+    "LLMResult": ".base",
+    "get_llm_provider": ".factory",
+}
+
+
+def __getattr__(name: str):
+    """Import public names on first access so importing the package stays cheap."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -1,12 +1,28 @@
 """Anthropic Claude LLM provider."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from .base import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Message batch polling interval (seconds), doubled up to the maximum
+BATCH_POLL_INITIAL = 5
+BATCH_POLL_MAX = 60
+
+# Default time to wait for a message batch to end (seconds)
+BATCH_TIMEOUT = 3600
+
+# System prompts at least this long (~1024 tokens, the smallest cacheable
+# prefix) are sent with a cache_control marker
+PROMPT_CACHE_MIN_CHARS = 4096
+
+# The messages API "system" argument: plain text or cache-marked text blocks
+_SystemParam = Union[str, List[Dict[str, Any]]]
+
 
 class AnthropicProvider(BaseLLMProvider):
     """
@@ -15,12 +31,17 @@ class AnthropicProvider(BaseLLMProvider):
     Uses the anthropic Python client for API access.
     """
 
+    # Context window of the Claude 3 and later models
+    context_window = 200_000
+
     def __init__(
         self,
         api_key: str,
         model: str = "claude-3-5-haiku-20241022",
         max_tokens: int = 2000,
         temperature: float = 0.1,
+        use_batch: bool = False,
+        batch_timeout: float = BATCH_TIMEOUT,
     ):
         """
         Initialize Anthropic provider.
@@ -30,14 +51,28 @@ class AnthropicProvider(BaseLLMProvider):
             model: Model name
             max_tokens: Default max tokens
             temperature: Default temperature
+            use_batch: Submit generate_batch() through the Message Batches API
+            batch_timeout: Seconds to wait for a message batch before cancelling it
         """
         self.api_key = api_key
         self.model = model
         self.default_max_tokens = max_tokens
         self.default_temperature = temperature
+        self.use_batch = use_batch
+        self.batch_timeout = batch_timeout
+
+        # Request arguments shared by every call
+        self._base_kwargs = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        self._system_cache: Optional[Tuple[str, _SystemParam]] = None
         self._client = None
+        self._async_client = None
+        self._async_loop = None
 
-        logger.info(f"Initialized Anthropic provider with model: {model}")
+        logger.info("Initialized Anthropic provider with model: %s", model)
 
     def _get_client(self):
         """Lazy load Anthropic client (only when needed)."""
@@ -59,12 +94,104 @@ class AnthropicProvider(BaseLLMProvider):
                     "Install with: pip install terminalbot[cloud]"
                 )
             except Exception as e:
-                logger.error(f"Failed to initialize Anthropic client: {e}")
+                logger.error("Failed to initialize Anthropic client: %s", e)
                 raise
 
         return self._client
 
-    def generate(
+    def _get_async_client(self):
+        """
+        Lazy load the async Anthropic client for the running event loop.
+
+        The client's connection pool is bound to the loop it was first used
+        on, so a new one is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError:
+                raise ImportError(
+                    "anthropic package required for Anthropic provider. "
+                    "Install with: pip install terminalbot[cloud]"
+                )
+
+            if not self.api_key:
+                raise ValueError("Anthropic API key not configured")
+
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+            self._async_loop = loop
+
+        return self._async_client
+
+    def _request_kwargs(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build messages.create() arguments, filling in the defaults."""
+        kwargs = self._shared_kwargs(system_prompt, temperature, max_tokens)
+        kwargs["messages"] = [{"role": "user", "content": prompt}]
+        return kwargs
+
+    def _shared_kwargs(
+        self,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the prompt-independent messages.create() arguments."""
+        kwargs = dict(self._base_kwargs)
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+
+        if system_prompt:
+            kwargs["system"] = self._system_param(system_prompt)
+
+        return kwargs
+
+    def _system_param(self, system_prompt: str) -> _SystemParam:
+        """
+        Build the system parameter, reusing it while the prompt is unchanged.
+
+        Long prompts are marked for prompt caching so repeated requests skip
+        re-processing the shared prefix.
+        """
+        if self._system_cache is not None and self._system_cache[0] == system_prompt:
+            return self._system_cache[1]
+
+        param: _SystemParam
+        if len(system_prompt) >= PROMPT_CACHE_MIN_CHARS:
+            param = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            param = system_prompt
+
+        self._system_cache = (system_prompt, param)
+        return param
+
+    @staticmethod
+    def _log_cache_usage(response) -> None:
+        """Log how much of the prompt was served from the prompt cache."""
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            logger.debug(
+                "Prompt cache: %s read, %s written, %s uncached input tokens",
+                getattr(usage, "cache_read_input_tokens", 0) or 0,
+                getattr(usage, "cache_creation_input_tokens", 0) or 0,
+                usage.input_tokens,
+            )
+
+    def _generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -85,41 +212,213 @@ class AnthropicProvider(BaseLLMProvider):
         """
         try:
             client = self._get_client()
+            response = client.messages.create(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+            )
+            self._log_cache_usage(response)
+            text: str = response.content[0].text
+            return text
 
-            # Use defaults if not specified
-            if temperature is None:
-                temperature = self.default_temperature
-            if max_tokens is None:
-                max_tokens = self.default_max_tokens
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("Anthropic generation failed: %s", e)
+            raise RuntimeError(f"Anthropic generation failed: {e}")
 
-            # Build message
-            messages = [{"role": "user", "content": prompt}]
+    async def _agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate completion using the async Anthropic client.
 
-            # Generate completion
-            kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
 
-            # Add system prompt if provided
-            if system_prompt:
-                kwargs["system"] = system_prompt
+        Returns:
+            Generated text
+        """
+        try:
+            client = self._get_async_client()
+            response = await client.messages.create(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+            )
+            self._log_cache_usage(response)
+            text: str = response.content[0].text
+            return text
 
-            response = client.messages.create(**kwargs)
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("Anthropic generation failed: %s", e)
+            raise RuntimeError(f"Anthropic generation failed: {e}")
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Stream completion chunks from Anthropic Claude.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
 
-            return response.content[0].text
+        Yields:
+            Chunks of generated text
+        """
+        prompt = self._fit_prompt(prompt, system_prompt, max_tokens)
+        try:
+            self._throttle()
+            client = self._get_client()
+            kwargs = self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+
+            with client.messages.stream(**kwargs) as stream:
+                yield from stream.text_stream
 
         except ImportError:
             raise
         except Exception as e:
-            logger.error(f"Anthropic generation failed: {e}")
-            raise RuntimeError(f"Anthropic generation failed: {e}")
+            logger.error("Anthropic streaming failed: %s", e)
+            raise RuntimeError(f"Anthropic streaming failed: {e}")
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate completions for several prompts.
+
+        With use_batch enabled, uncached prompts are submitted together
+        through the Message Batches API (half the token price, but results
+        can take minutes), so it is meant for offline work such as bulk log
+        analysis rather than interactive queries.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System instruction shared by every prompt (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate per prompt (provider default if None)
+
+        Returns:
+            Generated texts, in the same order as prompts
+
+        Raises:
+            RuntimeError: If the batch fails, times out or any request in it
+                fails (the responses that succeeded are cached first, so a
+                retry only resubmits the failed prompts)
+        """
+        if not self.use_batch or len(prompts) < 2:
+            return super().generate_batch(
+                prompts, system_prompt=system_prompt, temperature=temperature, max_tokens=max_tokens
+            )
+
+        responses: Dict[int, str] = {}
+        pending = {}
+        for i, prompt in enumerate(prompts):
+            cached, entry = self._cache_lookup(prompt, system_prompt, temperature, max_tokens)
+            if cached is not None:
+                responses[i] = cached
+            else:
+                pending[f"prompt-{i}"] = (i, entry)
+
+        if pending:
+            # Every request shares the same options; only the message differs
+            shared = self._shared_kwargs(system_prompt, temperature, max_tokens)
+            requests = {}
+            for custom_id, (i, _) in pending.items():
+                content = self._fit_prompt(prompts[i], system_prompt, max_tokens)
+                requests[custom_id] = {**shared, "messages": [{"role": "user", "content": content}]}
+            try:
+                results, errors = self._run_message_batch(requests)
+            except ImportError:
+                raise
+            except Exception as e:
+                logger.error("Anthropic batch generation failed: %s", e)
+                raise RuntimeError(f"Anthropic batch generation failed: {e}")
+
+            for custom_id, (i, entry) in pending.items():
+                if custom_id in results:
+                    responses[i] = results[custom_id]
+                    self._cache_store(entry, results[custom_id])
+
+            if errors:
+                failed = ", ".join(f"{custom_id} {error}" for custom_id, error in errors.items())
+                logger.error("Anthropic batch requests failed: %s", failed)
+                raise RuntimeError(f"Anthropic batch requests failed: {failed}")
+
+        return [responses[i] for i in range(len(prompts))]
+
+    def _run_message_batch(
+        self, requests: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Submit requests as one message batch and wait for the results.
+
+        Args:
+            requests: messages.create() arguments by custom_id
+
+        Returns:
+            Tuple of (generated text by custom_id, result type by custom_id
+            for requests that didn't succeed)
+
+        Raises:
+            TimeoutError: If the batch hasn't ended within batch_timeout
+                (it is cancelled)
+        """
+        client = self._get_client()
+        self._throttle()
+        batch = client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params} for custom_id, params in requests.items()
+            ]
+        )
+        logger.info("Submitted Anthropic message batch %s (%s requests)", batch.id, len(requests))
+
+        # Batches usually finish within minutes; back off to one poll a minute
+        delay = BATCH_POLL_INITIAL
+        deadline = time.monotonic() + self.batch_timeout
+        while batch.processing_status != "ended":
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                try:
+                    client.messages.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning("Failed to cancel message batch %s: %s", batch.id, e)
+                raise TimeoutError(
+                    f"Message batch {batch.id} did not end within {self.batch_timeout}s"
+                )
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, BATCH_POLL_MAX)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        errors = {}
+        for item in client.messages.batches.results(batch.id):
+            if item.result.type == "succeeded":
+                results[item.custom_id] = item.result.message.content[0].text
+            else:
+                errors[item.custom_id] = item.result.type
+
+        return results, errors
 
-    def is_available(self) -> bool:
+    def is_configured(self) -> bool:
         """
-        Check if Anthropic is available.
+        Check if Anthropic is configured.
 
         Returns:
             True if API key is configured
@@ -136,7 +435,7 @@ class AnthropicProvider(BaseLLMProvider):
             logger.debug("anthropic package not installed")
             return False
         except Exception as e:
-            logger.debug(f"Anthropic not available: {e}")
+            logger.debug("Anthropic not available: %s", e)
             return False
 
     def get_name(self) -> str:
@@ -1,7 +1,53 @@
 """Base LLM provider interface."""
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from ..utils import RateLimiter, TTLCache
+
+if TYPE_CHECKING:
+    from .disk_cache import DiskCache
+    from .semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Responses at or below this temperature are treated as deterministic and
+# cached; the low default (0.1) used for command generation qualifies
+CACHEABLE_MAX_TEMPERATURE = 0.1
+
+# Seconds a health check result is reused by is_available()
+AVAILABILITY_TTL = 60
+
+# Rough size of a token for English text and shell output; used to budget
+# prompts without loading a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Marks where an over-long prompt was shortened
+TRUNCATION_MARKER = "\n...[truncated]...\n"
+
+# (context hash, exact-match key, prompt embedding or None)
+_PendingEntry = Tuple[str, str, Optional[List[float]]]
+
+
+@dataclass(slots=True)
+class LLMResult:
+    """Outcome of a generation request."""
+
+    success: bool
+    response: str = ""
+    error: str = ""
 
 
 class BaseLLMProvider(ABC):
@@ -9,10 +55,279 @@ class BaseLLMProvider(ABC):
     Abstract base class for LLM providers.
 
     All providers (Ollama, OpenAI, Anthropic) implement this interface.
+    Providers implement _generate(); generate() adds an exact-match response
+    cache shared by all providers and, when configured, persistent and
+    semantic caches.
     """
 
-    @abstractmethod
+    # Shared across providers; keys include the provider name and model
+    response_cache = TTLCache(maxsize=1024, ttl=3600)
+
+    # Model context window in tokens; prompts that would overflow it are
+    # shortened before sending. None disables the check.
+    context_window: Optional[int] = None
+
+    # Worker threads for blocking calls made from async code
+    max_workers: int = 4
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    # Async SDK client of providers that have one, and the loop it's bound to
+    _async_client: Any = None
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Client-side request limit, set up by the factory when configured
+    rate_limiter: Optional[RateLimiter] = None
+
+    # Optional persistent and near-duplicate caches, set up by the factory
+    disk_cache: Optional["DiskCache"] = None
+    semantic_cache: Optional["SemanticCache"] = None
+
+    # Requests currently being generated by agenerate(), by cache key
+    _inflight: Dict[str, "asyncio.Future[str]"] = {}
+    _inflight_lock = threading.Lock()
+
+    # Last health check result and when it was made (monotonic clock)
+    _availability: Optional[Tuple[bool, float]] = None
+
     def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate text completion.
+
+        Low-temperature requests are answered from the response cache when an
+        identical request was made before.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Returns:
+            Generated text
+        """
+        cached, pending = self._cache_lookup(prompt, system_prompt, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        prompt = self._fit_prompt(prompt, system_prompt, max_tokens)
+        self._throttle()
+        response = self._generate(
+            prompt, system_prompt=system_prompt, **self._options(temperature, max_tokens)
+        )
+
+        self._cache_store(pending, response)
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate text completion without blocking the event loop.
+
+        Uses the same response caches as generate(). Several calls can be
+        awaited together (e.g. with asyncio.gather) to overlap their latency;
+        identical cacheable requests in flight at the same time share a single
+        backend call.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Returns:
+            Generated text
+        """
+        if self.semantic_cache is not None:
+            # Embedding the prompt is a blocking call
+            cached, pending = await self._run_blocking(
+                self._cache_lookup, prompt, system_prompt, temperature, max_tokens
+            )
+        else:
+            cached, pending = self._cache_lookup(prompt, system_prompt, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        options = self._options(temperature, max_tokens)
+        prompt = self._fit_prompt(prompt, system_prompt, max_tokens)
+        if pending is None:
+            # Not cacheable, so not shared with concurrent callers either
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            return await self._agenerate(prompt, system_prompt=system_prompt, **options)
+
+        # Single flight: concurrent identical requests await the first one
+        key = pending[1]
+        loop = asyncio.get_running_loop()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None and future.get_loop() is loop:
+                leader = False
+            else:
+                leader = True
+                future = loop.create_future()
+                self._inflight[key] = future
+
+        if not leader:
+            return await asyncio.shield(future)
+
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            response = await self._agenerate(prompt, system_prompt=system_prompt, **options)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here, even if nobody else waits
+            raise
+        else:
+            self._cache_store(pending, response)
+            future.set_result(response)
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+        return response
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter (if any) before a backend request."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _fit_prompt(
+        self, prompt: str, system_prompt: Optional[str], max_tokens: Optional[int]
+    ) -> str:
+        """
+        Shorten a prompt so the request fits in the model's context window.
+
+        Token counts are estimated from the text length. The start and end of
+        the prompt are kept (the question and the most recent output usually
+        matter most) and the middle is dropped, so an oversized request costs
+        no failed round-trip.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Returns:
+            The prompt, truncated if needed
+        """
+        if self.context_window is None:
+            return prompt
+
+        if max_tokens is None:
+            max_tokens = getattr(self, "default_max_tokens", 2000)
+        system_chars = len(system_prompt) if system_prompt else 0
+        limit = max((self.context_window - max_tokens) * CHARS_PER_TOKEN - system_chars, 0)
+        if len(prompt) <= limit:
+            return prompt
+
+        logger.warning(
+            "Prompt of ~%s tokens exceeds the %s token context window; truncating",
+            len(prompt) // CHARS_PER_TOKEN,
+            self.context_window,
+        )
+        keep = max(limit - len(TRUNCATION_MARKER), 0)
+        head = keep // 2
+        return prompt[:head] + TRUNCATION_MARKER + prompt[len(prompt) - (keep - head) :]
+
+    @staticmethod
+    def _options(temperature: Optional[float], max_tokens: Optional[int]) -> Dict[str, Any]:
+        """Collect the options that were set, leaving the rest to provider defaults."""
+        options: Dict[str, Any] = {}
+        if temperature is not None:
+            options["temperature"] = temperature
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+        return options
+
+    def _cache_lookup(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Tuple[Optional[str], Optional[_PendingEntry]]:
+        """
+        Look a request up in the response caches.
+
+        Returns:
+            Tuple of (cached response or None, entry to pass to _cache_store;
+            None when the request is not cacheable)
+        """
+        if temperature is not None and temperature > CACHEABLE_MAX_TEMPERATURE:
+            return None, None
+
+        context = self._cache_context(system_prompt, temperature, max_tokens)
+        key = self._cache_key(context, prompt)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached, None
+
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(key)
+            if cached is not None:
+                self.response_cache.set(key, cached)
+                return cached, None
+
+        embedding = None
+        if self.semantic_cache is not None:
+            try:
+                cached, embedding = self.semantic_cache.lookup(context, prompt)
+            except Exception as e:
+                logger.warning("Semantic cache lookup failed: %s", e)
+
+        return cached, (context, key, embedding)
+
+    def _cache_store(self, pending: Optional[_PendingEntry], response: str) -> None:
+        """Store a generated response under the entry from _cache_lookup."""
+        if pending is None:
+            return
+
+        context, key, embedding = pending
+        self.response_cache.set(key, response)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, response)
+        if embedding is not None and self.semantic_cache is not None:
+            self.semantic_cache.insert(context, embedding, response)
+
+    def _cache_context(
+        self,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """Hash everything besides the prompt that determines a response."""
+        request = {
+            "provider": self.get_name(),
+            "model": self.get_model_info().get("model"),
+            "system": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def _cache_key(context: str, prompt: str) -> str:
+        """Build the exact-match response cache key for a request."""
+        return hashlib.sha256(f"{context}|{prompt}".encode()).hexdigest()
+
+    @abstractmethod
+    def _generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -20,7 +335,7 @@ class BaseLLMProvider(ABC):
         max_tokens: int = 2000,
     ) -> str:
         """
-        Generate text completion.
+        Generate text completion from the backend (uncached).
 
         Args:
             prompt: User prompt
@@ -33,15 +348,268 @@ class BaseLLMProvider(ABC):
         """
         pass
 
-    @abstractmethod
+    async def _agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Async counterpart of _generate() (uncached).
+
+        The default implementation runs _generate() on the provider's worker
+        threads. Providers with an async client override this.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Returns:
+            Generated text
+        """
+        return await self._run_blocking(
+            self._generate,
+            prompt,
+            system_prompt=system_prompt,
+            **self._options(temperature, max_tokens),
+        )
+
+    async def _aclose_async_client(self) -> None:
+        """
+        Close the async client created for the running event loop, if any.
+
+        Async clients are bound to the loop they were created on; one made
+        for a short-lived loop must be closed before the loop ends, or its
+        connection pool is leaked.
+        """
+        client = self._async_client
+        if client is None or self._async_loop is not asyncio.get_running_loop():
+            return
+        self._async_client = None
+        self._async_loop = None
+
+        # SDK clients expose close(); the ollama client wraps an httpx client
+        close = getattr(client, "close", None) or getattr(
+            getattr(client, "_client", None), "aclose", None
+        )
+        if close is None:
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.debug("Failed to close %s async client: %s", self.get_name(), e)
+
+    async def _run_blocking(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """
+        Run a blocking call on the provider's thread pool.
+
+        The pool is sized by max_workers rather than shared with the event
+        loop's default executor, so concurrent requests are bounded by what
+        the backend can serve and don't starve other to_thread() users.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"terminalbot-{self.get_name()}"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def try_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResult:
+        """
+        Generate text completion, reporting failure as a result value.
+
+        Callers branch on LLMResult.success instead of handling provider
+        exceptions themselves.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Returns:
+            LLMResult with the generated text or the error message
+        """
+        try:
+            response = self.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception as e:
+            return LLMResult(success=False, error=str(e))
+
+        return LLMResult(success=True, response=response)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Generate text completion as a stream of chunks.
+
+        The default implementation yields the full generate() result at once.
+        Providers whose backend supports streaming override this so the first
+        chunk is available as soon as the model starts producing output.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate (provider default if None)
+
+        Yields:
+            Chunks of generated text
+        """
+        yield self.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate completions for several prompts sharing one system prompt.
+
+        The default implementation runs the prompts concurrently through
+        agenerate_batch() (sequentially when called from a running event
+        loop). Keeping the system prompt identical across the batch lets
+        server-side prefix caching reuse it.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System instruction shared by every prompt (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate per prompt (provider default if None)
+
+        Returns:
+            Generated texts, in the same order as prompts
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+
+            async def run() -> List[str]:
+                # The loop only lives for this call, so its async client
+                # can't be reused afterwards
+                try:
+                    return await self.agenerate_batch(
+                        prompts,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                finally:
+                    await self._aclose_async_client()
+
+            return asyncio.run(run())
+
+        return [
+            self.generate(
+                prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            for prompt in prompts
+        ]
+
+    async def agenerate_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate completions for several prompts concurrently.
+
+        Args:
+            prompts: User prompts
+            system_prompt: System instruction shared by every prompt (optional)
+            temperature: Sampling temperature (0-1, provider default if None)
+            max_tokens: Maximum tokens to generate per prompt (provider default if None)
+
+        Returns:
+            Generated texts, in the same order as prompts
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.agenerate(
+                        prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    for prompt in prompts
+                )
+            )
+        )
+
+    def is_configured(self) -> bool:
+        """
+        Check the provider has the configuration it needs (no network access).
+
+        Returns:
+            True if provider is configured
+        """
+        return True
+
+    def check_health(self) -> bool:
+        """
+        Check the backend can actually be used (may access the network).
+
+        Defaults to is_configured(); providers with a server to reach
+        override it.
+
+        Returns:
+            True if backend is reachable
+        """
+        return self.is_configured()
+
     def is_available(self) -> bool:
         """
         Check if provider is available and configured.
 
+        The health check result is remembered for AVAILABILITY_TTL seconds,
+        so repeated checks don't repeat network round-trips.
+
         Returns:
             True if provider can be used
         """
-        pass
+        if not self.is_configured():
+            return False
+
+        now = time.monotonic()
+        if self._availability is not None and now - self._availability[1] < AVAILABILITY_TTL:
+            return self._availability[0]
+
+        available = self.check_health()
+        self._availability = (available, now)
+        return available
 
     @abstractmethod
     def get_name(self) -> str:
@@ -53,6 +621,43 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def warm_up(self) -> None:
+        """
+        Import the SDK and create the client ahead of the first request.
+
+        Called by the factory once a provider is selected, so the first
+        generate() only pays for network latency.
+        """
+        get_client = getattr(self, "_get_client", None)
+        if get_client is not None:
+            get_client()
+
+    def close(self) -> None:
+        """
+        Close the provider's HTTP connections and worker threads.
+
+        Providers keep one SDK client (and its connection pool) for their
+        lifetime; call this when discarding the provider.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        client = getattr(self, "_client", None)
+        if client is None:
+            return
+
+        # SDK clients expose close(); the ollama client wraps an httpx client
+        close = getattr(client, "close", None) or getattr(
+            getattr(client, "_client", None), "close", None
+        )
+        if close is not None:
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Failed to close %s client: %s", self.get_name(), e)
+        self._client = None
+
     def get_model_info(self) -> Dict[str, str]:
         """
         Get information about the model being used.
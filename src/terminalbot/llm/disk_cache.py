@@ -0,0 +1,146 @@
+"""SQLite-backed response cache shared between TerminalBot processes."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Responses can include analyses of command output, so the cache is only
+# readable by its owner
+_DIR_MODE = 0o700
+_FILE_MODE = 0o600
+
+
+class DiskCache:
+    """
+    Persistent key/value cache with expiry and LRU culling.
+
+    Each CLI invocation is a new process, so the in-memory response cache
+    starts cold every time; this one survives between runs. Errors are
+    logged and treated as misses, so a broken cache file never breaks a
+    query.
+
+    The directory is created with mode 0700 and the database files with
+    mode 0600.
+    """
+
+    def __init__(self, path: Path, ttl: float = 3600, maxsize: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            ttl: Entry lifetime in seconds
+            maxsize: Maximum number of entries kept (least recently used culled)
+        """
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(mode=_DIR_MODE, parents=True, exist_ok=True)
+            # Create the file before SQLite does, which would use the umask;
+            # SQLite gives the -wal and -shm files the database's mode
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, _FILE_MODE))
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            # WAL lets concurrent CLI processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._restrict_files()
+            self._conn = conn
+        return self._conn
+
+    def _restrict_files(self) -> None:
+        """Make the database files (also ones from older versions) owner-only."""
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.chmod(f"{self.path}{suffix}", _FILE_MODE)
+            except FileNotFoundError:
+                continue
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss, expired entry or error
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires > ?", (key, now)
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                value: str = row[0]
+                return value
+        except sqlite3.Error as e:
+            logger.warning("Disk cache read failed: %s", e)
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value, culling expired and least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                        (key, value, now + self.ttl, now),
+                    )
+                    conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+                    conn.execute(
+                        "DELETE FROM responses WHERE key NOT IN "
+                        "(SELECT key FROM responses ORDER BY accessed DESC LIMIT ?)",
+                        (self.maxsize,),
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Disk cache write failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            logger.warning("Disk cache clear failed: %s", e)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,9 +1,13 @@
 """LLM provider factory with fallback support."""
 
+import atexit
 import logging
+import threading
+from pathlib import Path
 from typing import Optional
 
 from ..config import get_settings
+from ..utils import RateLimiter
 from .anthropic_provider import AnthropicProvider
 from .base import BaseLLMProvider
 from .ollama_provider import OllamaProvider
@@ -30,7 +34,10 @@ def create_provider(provider_name: str, settings=None) -> Optional[BaseLLMProvid
         if provider_name == "ollama":
             config = settings.llm.ollama
             provider = OllamaProvider(
-                model=config.model, base_url=config.base_url, timeout=config.timeout
+                model=config.model,
+                base_url=config.base_url,
+                timeout=config.timeout,
+                embedding_model=config.embedding_model,
             )
 
         elif provider_name == "openai":
@@ -55,25 +62,60 @@ def create_provider(provider_name: str, settings=None) -> Optional[BaseLLMProvid
                 model=config.model,
                 max_tokens=config.max_tokens,
                 temperature=config.temperature,
+                use_batch=config.use_batch,
+                batch_timeout=config.batch_timeout,
             )
 
         else:
-            logger.error(f"Unknown provider: {provider_name}")
+            logger.error("Unknown provider: %s", provider_name)
             return None
 
         # Verify provider is available
         if not provider.is_available():
-            logger.warning(f"Provider {provider_name} is not available")
+            logger.warning("Provider %s is not available", provider_name)
             return None
 
-        logger.info(f"Successfully created {provider_name} provider")
+        # Import the SDK now rather than on the first request; a missing SDK
+        # makes the provider unusable, so the fallback gets a chance instead
+        provider.warm_up()
+
+        _configure_caches(provider, settings)
+        provider.max_workers = settings.llm.concurrency
+
+        # Stay under the account's request rate instead of hitting 429 retries
+        rpm = getattr(config, "rpm", 0)
+        if rpm > 0:
+            provider.rate_limiter = RateLimiter(rpm, period=60)
+
+        logger.info("Successfully created %s provider", provider_name)
         return provider
 
     except Exception as e:
-        logger.warning(f"Failed to create {provider_name} provider: {e}")
+        logger.warning("Failed to create %s provider: %s", provider_name, e)
         return None
 
 
+def _configure_caches(provider: BaseLLMProvider, settings) -> None:
+    """Apply the performance settings to the provider's response caches."""
+    performance = settings.performance
+    BaseLLMProvider.response_cache.ttl = performance.cache_ttl
+
+    if performance.disk_cache and performance.cache_ttl > 0 and BaseLLMProvider.disk_cache is None:
+        from .disk_cache import DiskCache
+
+        BaseLLMProvider.disk_cache = DiskCache(
+            Path(performance.cache_dir).expanduser() / "llm_responses.db",
+            ttl=performance.cache_ttl,
+        )
+
+    threshold = performance.semantic_cache_threshold
+    if threshold > 0 and hasattr(provider, "embed"):
+        from .semantic_cache import SemanticCache
+
+        provider.semantic_cache = SemanticCache(provider.embed, threshold=threshold)
+        logger.info("Semantic cache enabled (threshold %s)", threshold)
+
+
 def get_llm_provider(settings=None) -> Optional[BaseLLMProvider]:
     """
     Get LLM provider with fallback support.
@@ -96,14 +138,14 @@ def get_llm_provider(settings=None) -> Optional[BaseLLMProvider]:
 
     # Try primary provider
     if settings.llm.primary:
-        logger.info(f"Trying primary provider: {settings.llm.primary}")
+        logger.info("Trying primary provider: %s", settings.llm.primary)
         provider = create_provider(settings.llm.primary, settings)
         if provider:
             return provider
 
     # Try fallback provider
     if settings.llm.fallback and settings.llm.fallback != settings.llm.primary:
-        logger.info(f"Trying fallback provider: {settings.llm.fallback}")
+        logger.info("Trying fallback provider: %s", settings.llm.fallback)
         provider = create_provider(settings.llm.fallback, settings)
         if provider:
             return provider
@@ -112,9 +154,11 @@ def get_llm_provider(settings=None) -> Optional[BaseLLMProvider]:
     return None
 
 
-# Singleton instance (lazy loaded)
+# Singleton instance (lazy loaded). _provider_loaded distinguishes "not
+# created yet" from a cached None (no provider available).
 _provider: Optional[BaseLLMProvider] = None
-_provider_initialized = False
+_provider_loaded = False
+_provider_lock = threading.Lock()
 
 
 def get_cached_provider(settings=None) -> Optional[BaseLLMProvider]:
@@ -123,6 +167,7 @@ def get_cached_provider(settings=None) -> Optional[BaseLLMProvider]:
 
     This avoids recreating the provider on every query, which is
     expensive for providers that need to establish connections.
+    Thread-safe: concurrent first calls create a single provider.
 
     Args:
         settings: Settings instance (uses default if None)
@@ -130,11 +175,14 @@ def get_cached_provider(settings=None) -> Optional[BaseLLMProvider]:
     Returns:
         Cached provider instance or None
     """
-    global _provider, _provider_initialized
+    global _provider, _provider_loaded
 
-    if not _provider_initialized:
-        _provider = get_llm_provider(settings)
-        _provider_initialized = True
+    if not _provider_loaded:
+        with _provider_lock:
+            if not _provider_loaded:
+                _provider = get_llm_provider(settings)
+                _provider_loaded = True
+                atexit.register(reset_provider)
 
     return _provider
 
@@ -142,7 +190,13 @@ def get_cached_provider(settings=None) -> Optional[BaseLLMProvider]:
 def reset_provider() -> None:
     """
     Reset cached provider (useful for testing or config changes).
+
+    The provider's HTTP connections are closed.
     """
-    global _provider, _provider_initialized
-    _provider = None
-    _provider_initialized = False
+    global _provider, _provider_loaded
+    with _provider_lock:
+        if _provider is not None:
+            _provider.close()
+        _provider = None
+        _provider_loaded = False
+    atexit.unregister(reset_provider)
@@ -1,12 +1,16 @@
 """Ollama LLM provider for local models."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .base import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Idle connections to the server kept open for reuse, per client
+KEEPALIVE_CONNECTIONS = 10
+
 
 class OllamaProvider(BaseLLMProvider):
     """
@@ -15,7 +19,13 @@ class OllamaProvider(BaseLLMProvider):
     Uses the ollama Python client for communication with local Ollama server.
     """
 
-    def __init__(self, model: str, base_url: str = "http://localhost:11434", timeout: int = 10):
+    def __init__(
+        self,
+        model: str,
+        base_url: str = "http://localhost:11434",
+        timeout: int = 10,
+        embedding_model: Optional[str] = None,
+    ):
         """
         Initialize Ollama provider.
 
@@ -23,22 +33,34 @@ class OllamaProvider(BaseLLMProvider):
             model: Model name (e.g., "llama3.2:1b")
             base_url: Ollama server URL
             timeout: Request timeout in seconds
+            embedding_model: Model used by embed() (defaults to model)
         """
         self.model = model
         self.base_url = base_url
         self.timeout = timeout
+        self.default_temperature = 0.1
+        self.default_max_tokens = 2000
+        self.embedding_model = embedding_model or model
         self._client = None
+        self._async_client = None
+        self._async_loop = None
 
-        logger.info(f"Initialized Ollama provider with model: {model}")
+        logger.info("Initialized Ollama provider with model: %s", model)
 
     def _get_client(self):
         """Lazy load Ollama client (only when needed)."""
         if self._client is None:
             try:
+                import httpx
                 import ollama
 
-                self._client = ollama.Client(host=self.base_url, timeout=self.timeout)
-                logger.info(f"Connected to Ollama at {self.base_url}")
+                # Keep connections to the server alive between requests
+                self._client = ollama.Client(
+                    host=self.base_url,
+                    timeout=self.timeout,
+                    limits=httpx.Limits(max_keepalive_connections=KEEPALIVE_CONNECTIONS),
+                )
+                logger.info("Connected to Ollama at %s", self.base_url)
             except ImportError:
                 logger.error(
                     "ollama package not installed. Install with: pip install ollama"
@@ -48,17 +70,66 @@ class OllamaProvider(BaseLLMProvider):
                     "Install with: pip install terminalbot[ollama]"
                 )
             except Exception as e:
-                logger.error(f"Failed to initialize Ollama client: {e}")
+                logger.error("Failed to initialize Ollama client: %s", e)
                 raise
 
         return self._client
 
-    def generate(
+    def _get_async_client(self):
+        """
+        Lazy load the async Ollama client for the running event loop.
+
+        The client's connection pool is bound to the loop it was first used
+        on, so a new one is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            try:
+                import httpx
+                import ollama
+            except ImportError:
+                raise ImportError(
+                    "ollama package required for Ollama provider. "
+                    "Install with: pip install terminalbot[ollama]"
+                )
+
+            self._async_client = ollama.AsyncClient(
+                host=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=KEEPALIVE_CONNECTIONS),
+            )
+            self._async_loop = loop
+
+        return self._async_client
+
+    def _request_kwargs(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build chat() arguments."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return {
+            "model": self.model,
+            "messages": messages,
+            "options": {
+                "temperature": self.default_temperature if temperature is None else temperature,
+                "num_predict": self.default_max_tokens if max_tokens is None else max_tokens,
+            },
+        }
+
+    def _generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        temperature: float = 0.1,
-        max_tokens: int = 2000,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
     ) -> str:
         """
         Generate completion using Ollama.
@@ -66,61 +137,162 @@ class OllamaProvider(BaseLLMProvider):
         Args:
             prompt: User prompt
             system_prompt: System instruction
-            temperature: Sampling temperature
-            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
 
         Returns:
             Generated text
         """
         try:
             client = self._get_client()
-
-            # Build messages
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            # Generate completion
             response = client.chat(
-                model=self.model,
-                messages=messages,
-                options={
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                },
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
             )
-
-            return response["message"]["content"]
+            content: str = response["message"]["content"]
+            return content
 
         except ImportError:
             raise
         except Exception as e:
-            logger.error(f"Ollama generation failed: {e}")
+            logger.error("Ollama generation failed: %s", e)
             raise RuntimeError(f"Ollama generation failed: {e}")
 
-    def is_available(self) -> bool:
+    async def _agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
         """
-        Check if Ollama is available.
+        Generate completion using the async Ollama client.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
 
         Returns:
-            True if Ollama server is reachable and model exists
+            Generated text
         """
         try:
+            client = self._get_async_client()
+            response = await client.chat(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+            )
+            content: str = response["message"]["content"]
+            return content
+
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("Ollama generation failed: %s", e)
+            raise RuntimeError(f"Ollama generation failed: {e}")
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Stream completion chunks from Ollama.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
+
+        Yields:
+            Chunks of generated text
+        """
+        prompt = self._fit_prompt(prompt, system_prompt, max_tokens)
+        try:
+            self._throttle()
             client = self._get_client()
+            stream = client.chat(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens),
+                stream=True,
+            )
+
+            for chunk in stream:
+                content = chunk["message"]["content"]
+                if content:
+                    yield content
+
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("Ollama streaming failed: %s", e)
+            raise RuntimeError(f"Ollama streaming failed: {e}")
+
+    def embed(self, text: str) -> List[float]:
+        """
+        Embed text with the local embedding model.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        client = self._get_client()
+        response = client.embeddings(model=self.embedding_model, prompt=text)
+        embedding: List[float] = response["embedding"]
+        return embedding
 
-            # Try to list models to check connectivity
-            models = client.list()
+    def has_model(self) -> bool:
+        """
+        Check if the model is present on the Ollama server.
 
-            # Check if our model is available
-            model_names = [m["name"] for m in models.get("models", [])]
-            if self.model not in model_names:
+        Returns:
+            True if the model has been pulled
+        """
+        client = self._get_client()
+        models = client.list()
+
+        names = set()
+        for m in models.get("models", []):
+            # Newer clients report "model", older ones "name"
+            name = m.get("model") or m.get("name")
+            if name:
+                names.add(name)
+
+        wanted = self.model if ":" in self.model else f"{self.model}:latest"
+        return self.model in names or wanted in names
+
+    def ensure_model(self) -> None:
+        """
+        Download the model if the server doesn't have it yet.
+
+        Pulls can take minutes, so this only runs when explicitly requested
+        (terminalbot ollama pull), never as part of a health check.
+        """
+        if self.has_model():
+            logger.info("Model %s already present", self.model)
+            return
+
+        logger.info("Pulling model %s...", self.model)
+        self._get_client().pull(self.model)
+        self._availability = None
+
+    def check_health(self) -> bool:
+        """
+        Check if Ollama is reachable and the model is present.
+
+        Returns:
+            True if Ollama server is reachable and model exists
+        """
+        try:
+            if not self.has_model():
                 logger.warning(
-                    f"Model {self.model} not found. Available models: {model_names}"
+                    "Model %s not found on the Ollama server. Run: terminalbot ollama pull",
+                    self.model,
                 )
-                logger.info(f"Pulling model {self.model}...")
-                # Try to pull the model
-                client.pull(self.model)
+                return False
 
             return True
 
@@ -128,7 +300,7 @@ class OllamaProvider(BaseLLMProvider):
             logger.debug("ollama package not installed")
             return False
         except Exception as e:
-            logger.debug(f"Ollama not available: {e}")
+            logger.debug("Ollama not available: %s", e)
             return False
 
     def get_name(self) -> str:
@@ -1,7 +1,8 @@
 """OpenAI LLM provider."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 from .base import BaseLLMProvider
 
@@ -15,6 +16,9 @@ class OpenAIProvider(BaseLLMProvider):
     Uses the openai Python client for API access.
     """
 
+    # Context window of the gpt-4o model family
+    context_window = 128_000
+
     def __init__(
         self, api_key: str, model: str = "gpt-4o-mini", max_tokens: int = 2000, temperature: float = 0.1
     ):
@@ -33,7 +37,16 @@ class OpenAIProvider(BaseLLMProvider):
         self.default_temperature = temperature
         self._client = None
 
-        logger.info(f"Initialized OpenAI provider with model: {model}")
+        # Request arguments shared by every call
+        self._base_kwargs = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        self._async_client = None
+        self._async_loop = None
+
+        logger.info("Initialized OpenAI provider with model: %s", model)
 
     def _get_client(self):
         """Lazy load OpenAI client (only when needed)."""
@@ -53,12 +66,58 @@ class OpenAIProvider(BaseLLMProvider):
                     "Install with: pip install terminalbot[cloud]"
                 )
             except Exception as e:
-                logger.error(f"Failed to initialize OpenAI client: {e}")
+                logger.error("Failed to initialize OpenAI client: %s", e)
                 raise
 
         return self._client
 
-    def generate(
+    def _get_async_client(self):
+        """
+        Lazy load the async OpenAI client for the running event loop.
+
+        The client's connection pool is bound to the loop it was first used
+        on, so a new one is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ImportError(
+                    "openai package required for OpenAI provider. "
+                    "Install with: pip install terminalbot[cloud]"
+                )
+
+            if not self.api_key:
+                raise ValueError("OpenAI API key not configured")
+
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+            self._async_loop = loop
+
+        return self._async_client
+
+    def _request_kwargs(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build chat.completions.create() arguments, filling in the defaults."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        kwargs = {**self._base_kwargs, "messages": messages}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+
+        return kwargs
+
+    def _generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -79,35 +138,92 @@ class OpenAIProvider(BaseLLMProvider):
         """
         try:
             client = self._get_client()
+            response = client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+            )
+            content: str = response.choices[0].message.content
+            return content
 
-            # Build messages
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("OpenAI generation failed: %s", e)
+            raise RuntimeError(f"OpenAI generation failed: {e}")
 
-            # Use defaults if not specified
-            if temperature is None:
-                temperature = self.default_temperature
-            if max_tokens is None:
-                max_tokens = self.default_max_tokens
+    async def _agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate completion using the async OpenAI client.
 
-            # Generate completion
-            response = client.chat.completions.create(
-                model=self.model, messages=messages, temperature=temperature, max_tokens=max_tokens
-            )
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
 
-            return response.choices[0].message.content
+        Returns:
+            Generated text
+        """
+        try:
+            client = self._get_async_client()
+            response = await client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens)
+            )
+            content: str = response.choices[0].message.content
+            return content
 
         except ImportError:
             raise
         except Exception as e:
-            logger.error(f"OpenAI generation failed: {e}")
+            logger.error("OpenAI generation failed: %s", e)
             raise RuntimeError(f"OpenAI generation failed: {e}")
 
-    def is_available(self) -> bool:
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Stream completion chunks from OpenAI.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (uses default if None)
+            max_tokens: Maximum tokens (uses default if None)
+
+        Yields:
+            Chunks of generated text
+        """
+        prompt = self._fit_prompt(prompt, system_prompt, max_tokens)
+        try:
+            self._throttle()
+            client = self._get_client()
+            stream = client.chat.completions.create(
+                **self._request_kwargs(prompt, system_prompt, temperature, max_tokens),
+                stream=True,
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.error("OpenAI streaming failed: %s", e)
+            raise RuntimeError(f"OpenAI streaming failed: {e}")
+
+    def is_configured(self) -> bool:
         """
-        Check if OpenAI is available.
+        Check if OpenAI is configured.
 
         Returns:
             True if API key is configured
@@ -124,7 +240,7 @@ class OpenAIProvider(BaseLLMProvider):
             logger.debug("openai package not installed")
             return False
         except Exception as e:
-            logger.debug(f"OpenAI not available: {e}")
+            logger.debug("OpenAI not available: %s", e)
             return False
 
     def get_name(self) -> str:
@@ -0,0 +1,109 @@
+"""Similarity-based response cache for near-duplicate prompts."""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Embedding = List[float]
+
+
+def _normalize(vector: Sequence[float]) -> Embedding:
+    """Scale a vector to unit length (so dot product == cosine similarity)."""
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """
+    Cache that answers a prompt with the response to a similar earlier prompt.
+
+    Prompts are embedded with the given function; a lookup hits when the
+    cosine similarity to a cached prompt reaches the threshold. Entries are
+    partitioned by a context key (provider, model, system prompt, options),
+    so only prompts asked under identical conditions are compared.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        maxsize: int = 256,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            embed: Function returning an embedding vector for a text
+            threshold: Minimum cosine similarity for a hit (0-1)
+            maxsize: Maximum number of entries kept (least recently used evicted)
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, Tuple[Hashable, Embedding, str]] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def lookup(self, context: Hashable, prompt: str) -> Tuple[Optional[str], Embedding]:
+        """
+        Find the response to the most similar cached prompt.
+
+        Args:
+            context: Everything besides the prompt that affects the response
+            prompt: User prompt
+
+        Returns:
+            Tuple of (cached response or None, prompt embedding). Pass the
+            embedding to insert() on a miss to avoid embedding twice.
+        """
+        vector = _normalize(self.embed(prompt))
+
+        with self._lock:
+            best_id, best_score = None, self.threshold
+            for entry_id, (entry_context, entry_vector, _) in self._entries.items():
+                # Vectors of another length come from a different embedding model
+                if entry_context != context or len(entry_vector) != len(vector):
+                    continue
+                score = sum(a * b for a, b in zip(vector, entry_vector, strict=True))
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                self.stats["misses"] += 1
+                return None, vector
+
+            self._entries.move_to_end(best_id)
+            self.stats["hits"] += 1
+            logger.debug("Semantic cache hit (similarity %.3f)", best_score)
+            return self._entries[best_id][2], vector
+
+    def insert(self, context: Hashable, embedding: Embedding, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            context: Context key the prompt was asked under
+            embedding: Normalized prompt embedding returned by lookup()
+            response: Generated response
+        """
+        with self._lock:
+            self._entries[self._next_id] = (context, embedding, response)
+            self._next_id += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
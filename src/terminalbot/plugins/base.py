@@ -1,7 +1,8 @@
 """Base plugin class."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from functools import cached_property
+from typing import Any, Dict, List, Optional
 
 
 class BasePlugin(ABC):
@@ -64,6 +65,15 @@ class BasePlugin(ABC):
         """
         return True
 
+    @cached_property
+    def _tool_index(self) -> Dict[str, Dict[str, Any]]:
+        """Tools by name, built from get_tools() on first lookup."""
+        return {tool["name"]: tool for tool in self.get_tools()}
+
+    def invalidate_tools(self) -> None:
+        """Rebuild the tool lookup on next use (call if get_tools() changes)."""
+        self.__dict__.pop("_tool_index", None)
+
     def get_tool_by_name(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific tool by name.
@@ -74,10 +84,7 @@ class BasePlugin(ABC):
         Returns:
             Tool definition or None if not found
         """
-        for tool in self.get_tools():
-            if tool["name"] == tool_name:
-                return tool
-        return None
+        return self._tool_index.get(tool_name)
 
     def execute_tool(self, tool_name: str, **kwargs) -> Any:
         """
@@ -100,5 +107,3 @@ class BasePlugin(ABC):
         func = tool["function"]
         return func(**kwargs)
 
-
-from typing import Optional  # noqa: E402 (import at end for forward reference)
@@ -1,18 +1,363 @@
 """Process management plugin."""
 
+import heapq
 import logging
+import os
 import re
-from typing import Any, Dict, List, Optional
-
-import psutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ..agent.safety import SafetyValidator
-from ..executor import CommandExecutor
+from ..executor import CommandExecutor, get_default_executor
 from .base import BasePlugin
 
+# psutil is imported where it's used: importing it is slow next to a CLI
+# start, and most queries never call these tools
+if TYPE_CHECKING:
+    import psutil
+
 logger = logging.getLogger(__name__)
 
 
+# On Linux, process tools read /proc directly instead of going through
+# psutil, which reads many more files per process than they need
+_USE_PROC = sys.platform.startswith("linux")
+
+# The kernel truncates /proc/<pid>/comm to 15 characters
+_COMM_LEN = 15
+
+# Seconds between the two CPU time samples of list_top_processes
+_CPU_SAMPLE_INTERVAL = 0.1
+
+# Command lines returned by list_top_processes are cut to this length
+_TOP_CMDLINE_LEN = 100
+
+
+@dataclass(slots=True)
+class _ProcUsage:
+    """Resource usage of one process, as collected by list_top_processes."""
+
+    pid: int
+    name: str
+    cmdline: str
+    cpu_percent: float
+    memory_percent: float
+
+
+def _join_cmdline(parts: List[str], limit: Optional[int] = None) -> str:
+    """
+    Join command line arguments, stopping once limit characters are reached.
+
+    Args:
+        parts: Command line arguments
+        limit: Maximum length of the result (None for the full command line)
+
+    Returns:
+        Space-separated command line, truncated to limit
+    """
+    if limit is None:
+        return " ".join(parts)
+
+    # Long command lines (e.g. Java or Chrome) can run to many kilobytes;
+    # only join the arguments that fit
+    head = []
+    length = 0
+    for part in parts:
+        head.append(part)
+        length += len(part) + 1
+        if length > limit:
+            break
+    return " ".join(head)[:limit]
+
+
+def _cmdline(proc: "psutil.Process", limit: Optional[int] = None) -> str:
+    """Get a process command line, or "" when it can't be read (e.g. zombies)."""
+    import psutil
+
+    try:
+        return _join_cmdline(proc.cmdline(), limit)
+    except (psutil.AccessDenied, psutil.ZombieProcess):
+        return ""
+
+
+@lru_cache(maxsize=64)
+def _name_pattern(name: str) -> "re.Pattern[str]":
+    """Compile a case-insensitive substring matcher for a process name."""
+    return re.compile(re.escape(name), re.IGNORECASE)
+
+
+def _read_proc_file(path: str, size: int = 4096) -> bytes:
+    """Read up to size bytes of a /proc file."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _proc_pids() -> List[str]:
+    """
+    List the PIDs in /proc.
+
+    Raises:
+        OSError: If /proc can't be listed
+    """
+    with os.scandir("/proc") as entries:
+        return [entry.name for entry in entries if entry.name.isdigit()]
+
+
+def _proc_args(pid: str, size: int = 1 << 16) -> List[str]:
+    """Read a process's arguments (up to size bytes) from /proc/<pid>/cmdline."""
+    raw = _read_proc_file(f"/proc/{pid}/cmdline", size)
+    return raw.decode(errors="replace").rstrip("\0").split("\0") if raw else []
+
+
+def _full_name(comm: str, args: List[str]) -> str:
+    """Complete a name truncated by the kernel from the command line, as psutil does."""
+    if len(comm) >= _COMM_LEN and args:
+        exe_name = os.path.basename(args[0])
+        if exe_name.startswith(comm):
+            return exe_name
+    return comm
+
+
+def _process_entry(proc: "psutil.Process", name: str, cmdline: str) -> Dict[str, Any]:
+    """Build the find_process() result for a matching process."""
+    with proc.oneshot():
+        return {
+            "pid": proc.pid,
+            "name": name,
+            "cmdline": cmdline,
+            "cpu_percent": proc.cpu_percent(),
+            "memory_percent": proc.memory_percent(),
+        }
+
+
+def _find_processes_psutil(pattern: "re.Pattern[str]", first: bool = False) -> List[Dict[str, Any]]:
+    """Find processes whose name matches pattern (only the first if first), using psutil."""
+    import psutil
+
+    processes = []
+
+    # Only the name is read for every process; the other fields are read
+    # for matches only
+    for proc in psutil.process_iter():
+        try:
+            proc_name = proc.name()
+            if pattern.search(proc_name):
+                processes.append(_process_entry(proc, proc_name, _cmdline(proc)))
+                if first:
+                    break
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    return processes
+
+
+def _find_processes_proc(pattern: "re.Pattern[str]", first: bool = False) -> List[Dict[str, Any]]:
+    """
+    Find processes whose name matches pattern by reading /proc (Linux).
+
+    Stops at the first match if first is set.
+
+    Only /proc/<pid>/comm is read for most processes.
+
+    Raises:
+        OSError: If /proc can't be listed
+    """
+    import psutil
+
+    processes = []
+
+    for pid in _proc_pids():
+        try:
+            comm = _read_proc_file(f"/proc/{pid}/comm", 64).decode(errors="replace").rstrip("\n")
+            if len(comm) < _COMM_LEN and not pattern.search(comm):
+                continue
+
+            args = _proc_args(pid)
+            proc_name = _full_name(comm, args)
+            if not pattern.search(proc_name):
+                continue
+
+            processes.append(
+                _process_entry(psutil.Process(int(pid)), proc_name, _join_cmdline(args))
+            )
+            if first:
+                break
+        except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
+            # The process exited, or its files can't be read
+            continue
+
+    return processes
+
+
+def _find_processes(name: str, first: bool = False) -> List[Dict[str, Any]]:
+    """Find processes whose name contains name (case-insensitive)."""
+    pattern = _name_pattern(name)
+    if _USE_PROC:
+        try:
+            return _find_processes_proc(pattern, first)
+        except OSError as e:
+            logger.debug(f"Reading /proc failed, using psutil: {e}")
+    return _find_processes_psutil(pattern, first)
+
+
+def _top(processes: List[_ProcUsage], sort_by: str, limit: int) -> List[_ProcUsage]:
+    """Pick the processes using the most CPU or memory, highest first."""
+    key = attrgetter("memory_percent" if sort_by == "memory" else "cpu_percent")
+    return heapq.nlargest(limit, processes, key=key)
+
+
+def _usage_info(proc: "psutil.Process", cpu: bool = True) -> Optional[_ProcUsage]:
+    """
+    Read a process's usage for list_top_processes (None if it's gone).
+
+    CPU usage is only read if cpu is set (the process must have been
+    primed); otherwise it's reported as 0.0.
+    """
+    import psutil
+
+    try:
+        with proc.oneshot():
+            return _ProcUsage(
+                proc.pid,
+                proc.name(),
+                _cmdline(proc, _TOP_CMDLINE_LEN),
+                proc.cpu_percent(None) if cpu else 0.0,
+                proc.memory_percent(),
+            )
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _top_processes_psutil(sort_by: str, limit: int) -> List[_ProcUsage]:
+    """Find the top processes by CPU or memory usage, using psutil."""
+    import psutil
+
+    if sort_by == "memory":
+        # CPU usage isn't needed, so there's nothing to prime or wait for
+        processes = []
+        for proc in psutil.process_iter():
+            info = _usage_info(proc, cpu=False)
+            if info:
+                processes.append(info)
+        return _top(processes, sort_by, limit)
+
+    # Prime the CPU counters (the first cpu_percent() call returns 0) and
+    # keep the Process objects, so the second pass doesn't walk and
+    # re-validate every PID again
+    procs = {}
+    for pid in psutil.pids():
+        try:
+            proc = psutil.Process(pid)
+            proc.cpu_percent()
+            procs[pid] = proc
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    time.sleep(_CPU_SAMPLE_INTERVAL)
+
+    # psutil releases the GIL while reading /proc, so the reads of different
+    # processes can overlap
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        processes = [info for info in pool.map(_usage_info, procs.values()) if info]
+
+    return _top(processes, sort_by, limit)
+
+
+def _read_stat(pid: str) -> Tuple[str, int]:
+    """
+    Read a process's name and CPU time (in clock ticks) from /proc/<pid>/stat.
+
+    The name is in parentheses and may itself contain spaces or
+    parentheses, so the fields are split after the last ")".
+    """
+    stat = _read_proc_file(f"/proc/{pid}/stat", 1024).decode(errors="replace")
+    open_paren, close_paren = stat.index("("), stat.rindex(")")
+    fields = stat[close_paren + 2 :].split()
+    # Fields 14 and 15 (utime, stime); fields[0] is field 3
+    return stat[open_paren + 1 : close_paren], int(fields[11]) + int(fields[12])
+
+
+def _cpu_times_proc() -> Dict[str, Tuple[str, int]]:
+    """Read the name and CPU time of every process from /proc."""
+    samples = {}
+    for pid in _proc_pids():
+        try:
+            samples[pid] = _read_stat(pid)
+        except (OSError, ValueError, IndexError):
+            continue
+    return samples
+
+
+def _top_processes_proc(sort_by: str, limit: int) -> List[_ProcUsage]:
+    """
+    Find the top processes by CPU or memory usage by reading /proc (Linux).
+
+    Reads stat twice (once when sorting by memory, which skips the CPU
+    sample and reports CPU usage as 0.0) and statm once per process;
+    command lines are read for the returned processes only.
+
+    Raises:
+        OSError: If /proc can't be listed
+    """
+    import psutil
+
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total_memory = psutil.virtual_memory().total
+
+    before = _cpu_times_proc()
+    if sort_by == "memory":
+        after, elapsed = before, None
+    else:
+        start = time.monotonic()
+        time.sleep(_CPU_SAMPLE_INTERVAL)
+        after = _cpu_times_proc()
+        elapsed = time.monotonic() - start
+
+    processes = []
+    for pid, (comm, ticks) in after.items():
+        if pid not in before:
+            continue
+        try:
+            rss_pages = int(_read_proc_file(f"/proc/{pid}/statm", 256).split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if elapsed is None:
+            cpu_percent = 0.0
+        else:
+            cpu_percent = round((ticks - before[pid][1]) / clock_ticks / elapsed * 100, 1)
+        processes.append(
+            _ProcUsage(
+                int(pid),
+                comm,
+                "",
+                cpu_percent,
+                rss_pages * page_size / total_memory * 100,
+            )
+        )
+
+    top = _top(processes, sort_by, limit)
+    for proc in top:
+        try:
+            # Only the start is used: the executable name and the truncated
+            # command line
+            args = _proc_args(str(proc.pid), 4096)
+        except OSError:
+            continue
+        proc.name = _full_name(proc.name, args)
+        proc.cmdline = _join_cmdline(args, _TOP_CMDLINE_LEN)
+
+    return top
+
+
 class ProcessesPlugin(BasePlugin):
     """
     Plugin for process management.
@@ -26,11 +371,25 @@ class ProcessesPlugin(BasePlugin):
         Initialize processes plugin.
 
         Args:
-            executor: Command executor (creates one if None)
-            safety: Safety validator (creates one if None)
+            executor: Command executor (shared default executor if None)
+            safety: Safety validator (created on first use if None)
         """
-        self.executor = executor or CommandExecutor()
-        self.safety = safety or SafetyValidator()
+        self._executor = executor
+        self._safety = safety
+
+    @property
+    def executor(self) -> CommandExecutor:
+        """Command executor used by the tools."""
+        if self._executor is None:
+            self._executor = get_default_executor()
+        return self._executor
+
+    @property
+    def safety(self) -> SafetyValidator:
+        """Safety validator used by the tools."""
+        if self._safety is None:
+            self._safety = SafetyValidator()
+        return self._safety
 
     @property
     def name(self) -> str:
@@ -95,7 +454,15 @@ class ProcessesPlugin(BasePlugin):
                         "type": "string",
                         "description": "Process name to check",
                         "required": True,
-                    }
+                    },
+                    "include_list": {
+                        "type": "boolean",
+                        "description": (
+                            "List and count every matching process "
+                            "(default: first match only, so count is at most 1)"
+                        ),
+                        "required": False,
+                    },
                 },
             },
         ]
@@ -111,24 +478,7 @@ class ProcessesPlugin(BasePlugin):
             Dict with matching processes
         """
         try:
-            processes = []
-            name_lower = name.lower()
-
-            for proc in psutil.process_iter(["pid", "name", "cmdline", "cpu_percent", "memory_percent"]):
-                try:
-                    proc_info = proc.info
-                    if name_lower in proc_info["name"].lower():
-                        processes.append(
-                            {
-                                "pid": proc_info["pid"],
-                                "name": proc_info["name"],
-                                "cmdline": " ".join(proc_info["cmdline"] or []),
-                                "cpu_percent": proc_info.get("cpu_percent", 0),
-                                "memory_percent": proc_info.get("memory_percent", 0),
-                            }
-                        )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            processes = _find_processes(name)
 
             return {
                 "success": True,
@@ -155,48 +505,20 @@ class ProcessesPlugin(BasePlugin):
             Dict with top processes
         """
         try:
-            processes = []
-
-            # Collect process info
-            for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent"]):
-                try:
-                    proc.cpu_percent()  # First call returns 0, so we call twice
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            # Small delay for accurate CPU measurement
-            import time
-            time.sleep(0.1)
-
-            for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_percent", "cmdline"]):
+            if _USE_PROC:
                 try:
-                    proc_info = proc.info
-                    processes.append(
-                        {
-                            "pid": proc_info["pid"],
-                            "name": proc_info["name"],
-                            "cmdline": " ".join(proc_info["cmdline"] or [])[:100],  # Truncate
-                            "cpu_percent": proc_info.get("cpu_percent", 0) or 0,
-                            "memory_percent": proc_info.get("memory_percent", 0) or 0,
-                        }
-                    )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            # Sort processes
-            if sort_by == "memory":
-                processes.sort(key=lambda p: p["memory_percent"], reverse=True)
-            else:  # default to CPU
-                processes.sort(key=lambda p: p["cpu_percent"], reverse=True)
-
-            # Limit results
-            top_processes = processes[:limit]
+                    top_processes = _top_processes_proc(sort_by, limit)
+                except OSError as e:
+                    logger.debug(f"Reading /proc failed, using psutil: {e}")
+                    top_processes = _top_processes_psutil(sort_by, limit)
+            else:
+                top_processes = _top_processes_psutil(sort_by, limit)
 
             return {
                 "success": True,
                 "sort_by": sort_by,
                 "count": len(top_processes),
-                "processes": top_processes,
+                "processes": [asdict(proc) for proc in top_processes],
             }
 
         except Exception as e:
@@ -216,6 +538,8 @@ class ProcessesPlugin(BasePlugin):
         Returns:
             Dict with process details
         """
+        import psutil
+
         try:
             proc = psutil.Process(pid)
             info = proc.as_dict(
@@ -253,26 +577,47 @@ class ProcessesPlugin(BasePlugin):
                 "error": str(e),
             }
 
-    def check_if_running(self, name: str) -> Dict[str, Any]:
+    def check_if_running(self, name: str, include_list: bool = False) -> Dict[str, Any]:
         """
         Check if a process is running.
 
+        Unless the full list is requested, the search stops at the first
+        matching process, so count is 0 or 1.
+
         Args:
             name: Process name
+            include_list: Return every matching process and their count
 
         Returns:
             Dict with running status
         """
-        result = self.find_process(name)
+        if include_list:
+            result = self.find_process(name)
+
+            if not result["success"]:
+                return result
 
-        if not result["success"]:
-            return result
+            is_running = result["count"] > 0
+
+            return {
+                "success": True,
+                "running": is_running,
+                "count": result["count"],
+                "processes": result["processes"] if is_running else [],
+            }
 
-        is_running = result["count"] > 0
+        try:
+            processes = _find_processes(name, first=True)
+        except Exception as e:
+            logger.error(f"Failed to find process: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+            }
 
         return {
             "success": True,
-            "running": is_running,
-            "count": result["count"],
-            "processes": result["processes"] if is_running else [],
+            "running": bool(processes),
+            "count": len(processes),
+            "processes": processes,
         }
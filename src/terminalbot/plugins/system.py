@@ -1,13 +1,71 @@
 """System information plugin."""
 
 import logging
-from typing import Any, Dict, List
+import math
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
-from ..executor import CommandExecutor
+from ..executor import CommandExecutor, get_default_executor
+from ..utils import TTLCache
 from .base import BasePlugin
 
 logger = logging.getLogger(__name__)
 
+# Seconds uptime and load averages are reused, so back-to-back tool calls
+# share one read
+UPTIME_TTL = 2.0
+
+
+def _humanize(num_bytes: float) -> str:
+    """Format a byte count the way free -h / df -h do (e.g. 1.5G)."""
+    for unit in ("B", "K", "M", "G", "T"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.0f}{unit}" if unit == "B" else f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}P"
+
+
+def _parse_os_release(text: str) -> Dict[str, str]:
+    """Parse os-release KEY=value lines, unquoting the values."""
+    info = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+
+        key, _, value = line.partition("=")
+        try:
+            parts = shlex.split(value)
+        except ValueError:
+            parts = [value]
+        info[key] = parts[0] if len(parts) == 1 else value
+    return info
+
+
+@lru_cache(maxsize=1)
+def _load_os_release() -> Tuple[str, Dict[str, str]]:
+    """
+    Read and parse /etc/os-release once per process.
+
+    Raises:
+        OSError: If the file can't be read (not cached, so retried next time)
+    """
+    with open("/etc/os-release") as f:
+        text = f.read()
+    return text, _parse_os_release(text)
+
+
+def _cached(cache: TTLCache, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a cached tool result, fetching it on a miss (failures aren't cached)."""
+    result = cache.get(key)
+    if result is None:
+        result = fetch()
+        if result["success"]:
+            cache.set(key, result)
+    return dict(result)
+
 
 class SystemPlugin(BasePlugin):
     """
@@ -22,9 +80,21 @@ class SystemPlugin(BasePlugin):
         Initialize system plugin.
 
         Args:
-            executor: Command executor (creates one if None)
+            executor: Command executor (shared default executor if None)
         """
-        self.executor = executor or CommandExecutor()
+        self._executor = executor
+
+        # Results depend on the executor (e.g. dry-run), so caches are per
+        # plugin. Kernel and distribution details don't change while we run.
+        self._static_cache = TTLCache(maxsize=8, ttl=math.inf)
+        self._uptime_cache = TTLCache(maxsize=1, ttl=UPTIME_TTL)
+
+    @property
+    def executor(self) -> CommandExecutor:
+        """Command executor used by the tools."""
+        if self._executor is None:
+            self._executor = get_default_executor()
+        return self._executor
 
     @property
     def name(self) -> str:
@@ -78,56 +148,120 @@ class SystemPlugin(BasePlugin):
         Returns:
             Dict with system details
         """
-        # Run multiple commands
-        uname_result = self.executor.execute_sync("uname -a")
-        uptime_result = self.executor.execute_sync("uptime")
+        uname = self._static_cache.get("uname")
+        if uname is None:
+            # Run uname alongside uptime instead of one after the other
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                future = pool.submit(_cached, self._static_cache, "uname", self._uname)
+                uptime = self.get_uptime()
+                uname = future.result()
+        else:
+            uptime = self.get_uptime()
 
         return {
-            "success": uname_result.success and uptime_result.success,
-            "system": uname_result.stdout.strip() if uname_result.success else "Unknown",
-            "uptime": uptime_result.stdout.strip() if uptime_result.success else "Unknown",
+            "success": uname["success"] and uptime["success"],
+            "system": uname.get("system", "Unknown"),
+            "uptime": uptime.get("uptime", "Unknown"),
         }
 
+    def _uname(self) -> Dict[str, Any]:
+        """Run uname -a."""
+        result = self.executor.execute_sync("uname -a", fast_path=True)
+        if not result.success:
+            return {"success": False, "error": result.stderr}
+        return {"success": True, "system": result.stdout.strip()}
+
     def check_disk_space(self) -> Dict[str, Any]:
         """
         Check disk space usage.
 
+        Read in-process with psutil instead of running df.
+
         Returns:
             Dict with disk usage information
         """
-        result = self.executor.execute_sync("df -h")
+        import psutil
 
-        if not result.success:
+        try:
+            filesystems = []
+            for part in psutil.disk_partitions(all=False):
+                try:
+                    usage = psutil.disk_usage(part.mountpoint)
+                except OSError:
+                    # Unreadable or vanished mount (e.g. permission denied)
+                    continue
+                filesystems.append(
+                    {
+                        "device": part.device,
+                        "mountpoint": part.mountpoint,
+                        "fstype": part.fstype,
+                        "total": usage.total,
+                        "used": usage.used,
+                        "free": usage.free,
+                        "percent": usage.percent,
+                    }
+                )
+        except Exception as e:
+            logger.error(f"Failed to check disk space: {e}")
             return {
                 "success": False,
-                "error": result.stderr,
+                "error": str(e),
             }
 
+        lines = [f"{'Filesystem':<24} {'Size':>7} {'Used':>7} {'Avail':>7} {'Use%':>5} Mounted on"]
+        for fs in filesystems:
+            lines.append(
+                f"{fs['device']:<24} {_humanize(fs['total']):>7} {_humanize(fs['used']):>7} "
+                f"{_humanize(fs['free']):>7} {fs['percent']:>4.0f}% {fs['mountpoint']}"
+            )
+        output = "\n".join(lines) + "\n"
+
         return {
             "success": True,
-            "output": result.stdout,
-            "raw_output": result.stdout,
+            "output": output,
+            "raw_output": output,
+            "filesystems": filesystems,
         }
 
     def check_memory(self) -> Dict[str, Any]:
         """
         Check memory usage.
 
+        Read in-process with psutil instead of running free.
+
         Returns:
             Dict with memory usage information
         """
-        result = self.executor.execute_sync("free -h")
+        import psutil
 
-        if not result.success:
+        try:
+            vm = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+        except Exception as e:
+            logger.error(f"Failed to check memory: {e}")
             return {
                 "success": False,
-                "error": result.stderr,
+                "error": str(e),
             }
 
+        output = (
+            f"{'':<6} {'total':>8} {'used':>8} {'free':>8} {'available':>10}\n"
+            f"{'Mem:':<6} {_humanize(vm.total):>8} {_humanize(vm.used):>8} "
+            f"{_humanize(vm.free):>8} {_humanize(vm.available):>10}\n"
+            f"{'Swap:':<6} {_humanize(swap.total):>8} {_humanize(swap.used):>8} "
+            f"{_humanize(swap.free):>8}\n"
+        )
+
         return {
             "success": True,
-            "output": result.stdout,
-            "raw_output": result.stdout,
+            "output": output,
+            "raw_output": output,
+            "total": vm.total,
+            "available": vm.available,
+            "used": vm.used,
+            "percent": vm.percent,
+            "swap_total": swap.total,
+            "swap_used": swap.used,
         }
 
     def get_uptime(self) -> Dict[str, Any]:
@@ -137,7 +271,11 @@ class SystemPlugin(BasePlugin):
         Returns:
             Dict with uptime information
         """
-        result = self.executor.execute_sync("uptime")
+        return _cached(self._uptime_cache, "uptime", self._uptime)
+
+    def _uptime(self) -> Dict[str, Any]:
+        """Run uptime."""
+        result = self.executor.execute_sync("uptime", fast_path=True)
 
         if not result.success:
             return {
@@ -155,14 +293,21 @@ class SystemPlugin(BasePlugin):
         Get OS and distribution information.
 
         Returns:
-            Dict with OS details
+            Dict with OS details; os_release holds the parsed /etc/os-release
+            fields (NAME, VERSION_ID, ...) when available
         """
-        # Try /etc/os-release first (standard)
-        result = self.executor.execute_sync("cat /etc/os-release")
+        return _cached(self._static_cache, "os", self._os_info)
 
-        if not result.success:
-            # Fallback to lsb_release
-            result = self.executor.execute_sync("lsb_release -a")
+    def _os_info(self) -> Dict[str, Any]:
+        """Read /etc/os-release, falling back to lsb_release."""
+        # /etc/os-release is standard; read it without spawning a process
+        try:
+            text, fields = _load_os_release()
+            return {"success": True, "output": text, "os_release": dict(fields)}
+        except OSError:
+            pass
+
+        result = self.executor.execute_sync("lsb_release -a", fast_path=True)
 
         if not result.success:
             return {
@@ -1,3 +1,6 @@
 """Utility functions."""
 
-# Placeholder for future utilities
+from .cache import TTLCache
+from .rate_limit import RateLimiter
+
+__all__ = ["TTLCache", "RateLimiter"]
@@ -0,0 +1,59 @@
+"""Client-side request rate limiting."""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Admits up to `rate` requests per `period` seconds, allowing bursts of up
+    to `rate` requests. Callers over the limit wait for their turn instead
+    of being rejected, in the order they arrived.
+    """
+
+    def __init__(self, rate: float, period: float = 60):
+        """
+        Initialize limiter.
+
+        Args:
+            rate: Requests allowed per period
+            period: Period length in seconds
+        """
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, possibly one that hasn't been refilled yet.
+
+        Returns:
+            Seconds to wait before the token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.fill_rate)
+            self._updated = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.fill_rate
+
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be made."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -16,3 +16,19 @@ def test_settings():
 def executor(test_settings):
     """Create command executor for testing."""
     return CommandExecutor(test_settings)
+
+
+@pytest.fixture(scope="session")
+def matcher():
+    """Rule-based matcher, compiled once for the whole test run."""
+    from terminalbot.agent.rule_based import get_matcher
+
+    return get_matcher()
+
+
+@pytest.fixture(scope="session")
+def safety():
+    """Safety validator with default settings, shared by the whole test run."""
+    from terminalbot.agent.safety import SafetyValidator
+
+    return SafetyValidator()
@@ -0,0 +1,105 @@
+"""Tests for in-memory caches."""
+
+import os
+import stat
+
+from terminalbot.llm.disk_cache import DiskCache
+from terminalbot.utils import TTLCache
+
+
+def test_ttl_cache_hit_and_miss():
+    """Test storing and retrieving cached values."""
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test LRU eviction once maxsize is exceeded."""
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    """Test entries expire after the ttl."""
+    now = [1000.0]
+    monkeypatch.setattr("terminalbot.utils.cache.time.monotonic", lambda: now[0])
+
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", "value")
+
+    now[0] += 9
+    assert cache.get("key") == "value"
+
+    now[0] += 2
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_disabled():
+    """Test a zero ttl disables caching."""
+    cache = TTLCache(ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_disk_cache_persists_between_instances(tmp_path):
+    """Test entries written by one cache are read by another on the same file."""
+    path = tmp_path / "cache.db"
+    DiskCache(path, ttl=60).set("key", "value")
+
+    cache = DiskCache(path, ttl=60)
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+
+
+def test_disk_cache_culls_least_recently_used(tmp_path, monkeypatch):
+    """Test the oldest entries are removed once maxsize is exceeded."""
+    now = [1000.0]
+    monkeypatch.setattr("terminalbot.llm.disk_cache.time.time", lambda: now[0])
+    cache = DiskCache(tmp_path / "cache.db", ttl=60, maxsize=2)
+
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        cache.set(key, key)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+
+    now[0] += 120
+    assert cache.get("c") is None
+
+
+def test_disk_cache_files_are_private(tmp_path):
+    """Test the cache directory and database files are only accessible by the owner."""
+    old_umask = os.umask(0o022)
+    try:
+        cache = DiskCache(tmp_path / "cache" / "cache.db", ttl=60)
+        cache.set("key", "value")
+        # Files left by an older version are tightened too
+        old = tmp_path / "old.db"
+        old.touch(mode=0o644)
+        DiskCache(old, ttl=60).set("key", "value")
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+    paths = [tmp_path / "cache" / f"cache.db{suffix}" for suffix in ("", "-wal", "-shm")]
+    assert paths[1].exists()
+    for path in [*paths, old]:
+        if path.exists():
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    cache.close()
@@ -1,7 +1,12 @@
 """Tests for command executor."""
 
+import atexit
+
 import pytest
 
+from terminalbot.executor import CommandExecutor
+from terminalbot.executor.command import _needs_shell
+
 
 @pytest.mark.asyncio
 async def test_execute_simple_command(executor):
@@ -41,8 +46,79 @@ async def test_execute_with_working_directory(executor, tmp_path):
 
 
 def test_execute_sync(executor):
-    """Test synchronous execution wrapper."""
+    """Test synchronous execution."""
     result = executor.execute_sync("echo 'test'")
 
     assert result.success
     assert "test" in result.stdout
+
+
+def test_execute_sync_with_timeout(executor):
+    """Test timeout enforcement in the blocking path."""
+    result = executor.execute_sync("sleep 5", timeout=1)
+
+    assert result.timed_out
+    assert not result.success
+
+
+@pytest.mark.asyncio
+async def test_execute_without_shell(executor):
+    """Test simple commands run directly and builtins still work."""
+    assert not _needs_shell("echo hello")
+    assert _needs_shell("echo hello | wc -c")
+
+    result = await executor.execute("echo hello")
+    assert result.success
+    assert result.stdout == "hello\n"
+
+    result = await executor.execute("cd /")
+    assert result.success
+
+
+def test_history_flushed_on_close(test_settings, tmp_path):
+    """Test buffered history lines reach the file on close."""
+    test_settings.logging.history_file = str(tmp_path / "history")
+    executor = CommandExecutor(test_settings)
+
+    executor.execute_sync("echo logged")
+    executor.close()
+
+    assert "| SUCCESS | echo logged" in executor.history_file.read_text()
+
+
+@pytest.mark.asyncio
+async def test_output_capped_while_streaming(test_settings):
+    """Test large output is capped and marked as truncated."""
+    test_settings.execution.max_output_size = 1000
+    executor = CommandExecutor(test_settings)
+
+    result = await executor.execute("head -c 1000000 /dev/zero")
+    assert result.success
+    assert result.truncated
+    assert len(result.stdout) < 1100
+
+    result = executor.execute_sync("head -c 1000000 /dev/zero")
+    assert result.truncated
+    assert len(result.stdout) < 1100
+
+
+def test_execute_sync_fast_path(executor, tmp_path):
+    """Test fast-path commands reuse one shell and recover from a timeout."""
+    callbacks = atexit._ncallbacks()
+    result = executor.execute_sync("pwd; echo oops >&2; false", cwd=str(tmp_path), fast_path=True)
+    shell = executor._shell
+
+    assert result.stdout.strip() == str(tmp_path)
+    assert result.stderr == "oops\n"
+    assert result.returncode == 1
+
+    assert executor.execute_sync("printf done", fast_path=True).stdout == "done"
+    assert executor._shell is shell
+
+    assert executor.execute_sync("sleep 5", timeout=1, fast_path=True).timed_out
+    assert executor.execute_sync("echo again", fast_path=True).stdout == "again\n"
+    # Restarting the shell doesn't register close() again
+    assert atexit._ncallbacks() == callbacks + 1
+
+    executor.close()
+    assert executor._shell is None
@@ -0,0 +1,365 @@
+"""Tests for the LLM provider base class."""
+
+import asyncio
+
+import pytest
+
+from terminalbot.llm.base import BaseLLMProvider
+from terminalbot.llm.semantic_cache import SemanticCache
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider that counts backend calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _generate(self, prompt, system_prompt=None, temperature=0.1, max_tokens=2000):
+        self.calls += 1
+        return f"{prompt}: response {self.calls}"
+
+    def get_name(self):
+        return "fake"
+
+
+@pytest.fixture
+def provider():
+    """Create a fake provider with an empty response cache."""
+    BaseLLMProvider.response_cache.clear()
+    yield FakeProvider()
+    BaseLLMProvider.response_cache.clear()
+
+
+def test_generate_caches_identical_requests(provider):
+    """Test repeated low-temperature requests hit the cache."""
+    first = provider.generate("list files", temperature=0.1)
+    second = provider.generate("list files", temperature=0.1)
+
+    assert first == second
+    assert provider.calls == 1
+
+    provider.generate("list files", system_prompt="other", temperature=0.1)
+    assert provider.calls == 2
+
+
+def test_generate_skips_cache_for_high_temperature(provider):
+    """Test sampled requests always reach the backend."""
+    provider.generate("tell a joke", temperature=0.9)
+    provider.generate("tell a joke", temperature=0.9)
+
+    assert provider.calls == 2
+
+
+def test_semantic_cache_reuses_similar_prompts(provider):
+    """Test near-duplicate prompts share a response under the same context."""
+    vectors = {
+        "show running processes": [1.0, 0.0, 0.1],
+        "show the running processes": [1.0, 0.0, 0.12],
+        "check disk space": [0.0, 1.0, 0.0],
+    }
+    provider.semantic_cache = SemanticCache(vectors.__getitem__, threshold=0.95)
+
+    first = provider.generate("show running processes", temperature=0.1)
+    assert provider.generate("show the running processes", temperature=0.1) == first
+    assert provider.calls == 1
+
+    provider.generate("check disk space", temperature=0.1)
+    provider.generate("show the running processes", system_prompt="other", temperature=0.1)
+    assert provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_agenerate_shares_response_cache(provider):
+    """Test async generation uses the same cache as generate()."""
+    first = provider.generate("list files", temperature=0.1)
+
+    assert await provider.agenerate("list files", temperature=0.1) == first
+    assert provider.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_default_agenerate_forwards_only_set_options(provider):
+    """Test the threaded fallback leaves omitted options to _generate()."""
+    received = []
+
+    class RecordingProvider(FakeProvider):
+        def _generate(self, prompt, system_prompt=None, **options):
+            received.append(options)
+            return "ok"
+
+    assert await RecordingProvider()._agenerate("a") == "ok"
+    assert await RecordingProvider()._agenerate("b", max_tokens=64) == "ok"
+    assert received == [{}, {"max_tokens": 64}]
+
+
+def test_generate_batch_keeps_prompt_order(provider):
+    """Test concurrent batch generation returns responses in prompt order."""
+    responses = provider.generate_batch(["a", "b", "c"], temperature=0.9)
+
+    assert [response.split(":")[0] for response in responses] == ["a", "b", "c"]
+    assert provider.calls == 3
+
+
+def test_anthropic_batch_maps_results_by_custom_id(monkeypatch):
+    """Test message batch results are returned in prompt order."""
+    from types import SimpleNamespace
+
+    from terminalbot.llm.anthropic_provider import AnthropicProvider
+
+    class FakeBatches:
+        def create(self, requests):
+            self.requests = requests
+            return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+        def retrieve(self, batch_id):
+            return SimpleNamespace(id=batch_id, processing_status="ended")
+
+        def results(self, batch_id):
+            # Results arrive in arbitrary order
+            for request in reversed(self.requests):
+                message = SimpleNamespace(
+                    content=[SimpleNamespace(text=request["params"]["messages"][0]["content"])]
+                )
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=SimpleNamespace(type="succeeded", message=message),
+                )
+
+    monkeypatch.setattr("terminalbot.llm.anthropic_provider.time.sleep", lambda _: None)
+    BaseLLMProvider.response_cache.clear()
+
+    provider = AnthropicProvider(api_key="test", use_batch=True)
+    provider._client = SimpleNamespace(messages=SimpleNamespace(batches=FakeBatches()))
+
+    assert provider.generate_batch(["a", "b", "c"]) == ["a", "b", "c"]
+    BaseLLMProvider.response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_agenerate_coalesces_concurrent_duplicates(provider):
+    """Test identical concurrent requests share one backend call."""
+    responses = await asyncio.gather(
+        *(provider.agenerate("list files", temperature=0.1) for _ in range(5))
+    )
+
+    assert len(set(responses)) == 1
+    assert provider.calls == 1
+
+
+def test_is_available_reuses_health_check():
+    """Test the health check runs once within the availability ttl."""
+
+    class ProbedProvider(FakeProvider):
+        checks = 0
+
+        def check_health(self):
+            self.checks += 1
+            return True
+
+    provider = ProbedProvider()
+    assert provider.is_available()
+    assert provider.is_available()
+    assert provider.checks == 1
+
+
+def test_generate_truncates_prompt_to_context_window(provider):
+    """Test over-long prompts are shortened to fit the context window."""
+    provider.context_window = 150
+    prompt = "start " + "x" * 2000 + " end"
+
+    response = provider.generate(prompt, max_tokens=50)
+
+    sent = response.rsplit(": response", 1)[0]
+    assert len(sent) <= 100 * 4
+    assert sent.startswith("start ") and sent.endswith(" end")
+    assert provider.generate("short", max_tokens=50).startswith("short:")
+
+
+@pytest.mark.asyncio
+async def test_agenerate_runs_on_provider_pool():
+    """Test blocking backends run on the provider's own worker threads."""
+    import threading
+
+    class ThreadProvider(FakeProvider):
+        def _generate(self, prompt, **options):
+            return threading.current_thread().name
+
+    provider = ThreadProvider()
+    name = await provider.agenerate("which thread", temperature=0.9)
+
+    assert name.startswith("terminalbot-fake")
+    provider.close()
+    assert provider._executor is None
+
+
+def test_ollama_health_check_does_not_pull_missing_model():
+    """Test a missing model makes Ollama unavailable instead of downloading it."""
+    from types import SimpleNamespace
+
+    from terminalbot.llm.ollama_provider import OllamaProvider
+
+    pulled = []
+    provider = OllamaProvider(model="llama3.2:1b")
+    provider._client = SimpleNamespace(
+        list=lambda: {"models": [{"model": "qwen2.5:0.5b"}]}, pull=pulled.append
+    )
+
+    assert not provider.check_health()
+    assert pulled == []
+
+    provider.ensure_model()
+    assert pulled == ["llama3.2:1b"]
+
+
+def test_stream_and_batch_truncate_prompt_to_context_window(monkeypatch):
+    """Test streamed and message-batch requests are fitted to the context window."""
+    from contextlib import contextmanager
+    from types import SimpleNamespace
+
+    from terminalbot.llm.anthropic_provider import AnthropicProvider
+
+    sent = []
+
+    @contextmanager
+    def stream(**kwargs):
+        sent.append(kwargs["messages"][0]["content"])
+        yield SimpleNamespace(text_stream=iter(["ok"]))
+
+    class FakeBatches:
+        def create(self, requests):
+            sent.extend(request["params"]["messages"][0]["content"] for request in requests)
+            self.requests = requests
+            return SimpleNamespace(id="batch-1", processing_status="ended")
+
+        def results(self, batch_id):
+            for request in self.requests:
+                message = SimpleNamespace(content=[SimpleNamespace(text="ok")])
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=SimpleNamespace(type="succeeded", message=message),
+                )
+
+    BaseLLMProvider.response_cache.clear()
+    provider = AnthropicProvider(api_key="test", use_batch=True)
+    provider.context_window = 150
+    provider._client = SimpleNamespace(
+        messages=SimpleNamespace(stream=stream, batches=FakeBatches())
+    )
+    prompt = "start " + "x" * 2000 + " end"
+
+    assert "".join(provider.generate_stream(prompt, max_tokens=50)) == "ok"
+    assert provider.generate_batch([prompt, prompt + "!"], max_tokens=50) == ["ok", "ok"]
+
+    assert len(sent) == 3
+    assert all(len(text) <= 100 * 4 and text.startswith("start ") for text in sent)
+    BaseLLMProvider.response_cache.clear()
+
+
+def test_generate_batch_closes_async_client_of_its_loop():
+    """Test generate_batch() closes the async client made for its temporary loop."""
+    closed = []
+
+    class AsyncClient:
+        async def close(self):
+            closed.append(self)
+
+    class AsyncProvider(FakeProvider):
+        _async_client = None
+        _async_loop = None
+
+        async def _agenerate(self, prompt, system_prompt=None, temperature=0.1, max_tokens=2000):
+            loop = asyncio.get_running_loop()
+            if self._async_loop is not loop:
+                self._async_client, self._async_loop = AsyncClient(), loop
+            return self._generate(prompt)
+
+    provider = AsyncProvider()
+    provider.generate_batch(["a", "b"], temperature=0.9)
+    provider.generate_batch(["c"], temperature=0.9)
+
+    assert len(closed) == 2
+    assert provider._async_client is None
+
+
+def test_anthropic_batch_caches_successes_before_failing(monkeypatch):
+    """Test a failed batch item keeps the other results and a stuck batch times out."""
+    from types import SimpleNamespace
+
+    from terminalbot.llm.anthropic_provider import AnthropicProvider
+
+    class FakeBatches:
+        status = "ended"
+        cancelled = []
+
+        def create(self, requests):
+            self.requests = requests
+            return SimpleNamespace(id="batch-1", processing_status=self.status)
+
+        def retrieve(self, batch_id):
+            return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+        def cancel(self, batch_id):
+            self.cancelled.append(batch_id)
+
+        def results(self, batch_id):
+            for request in self.requests:
+                text = request["params"]["messages"][0]["content"]
+                message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+                result_type = "errored" if text == "bad" else "succeeded"
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=SimpleNamespace(type=result_type, message=message),
+                )
+
+    now = [0.0]
+    monkeypatch.setattr("terminalbot.llm.anthropic_provider.time.monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        "terminalbot.llm.anthropic_provider.time.sleep", lambda s: now.__setitem__(0, now[0] + s)
+    )
+    BaseLLMProvider.response_cache.clear()
+
+    batches = FakeBatches()
+    provider = AnthropicProvider(api_key="test", use_batch=True, batch_timeout=30)
+    provider._client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    with pytest.raises(RuntimeError, match="prompt-1 errored"):
+        provider.generate_batch(["good", "bad"])
+    # The retry only resubmits the failed prompt
+    with pytest.raises(RuntimeError):
+        provider.generate_batch(["good", "bad"])
+    assert [request["custom_id"] for request in batches.requests] == ["prompt-1"]
+
+    batches.status = "in_progress"
+    with pytest.raises(RuntimeError, match="did not end within 30s"):
+        provider.generate_batch(["a", "b"])
+    assert batches.cancelled == ["batch-1"]
+    assert now[0] == 30
+    BaseLLMProvider.response_cache.clear()
+
+
+def test_semantic_cache_skips_other_embedding_sizes():
+    """Test vectors from a differently sized embedding model are never compared."""
+    vectors = {"old": [1.0, 0.0], "new": [1.0, 0.0, 0.0]}
+    cache = SemanticCache(vectors.__getitem__, threshold=0.5)
+
+    _, embedding = cache.lookup("ctx", "old")
+    cache.insert("ctx", embedding, "old response")
+
+    assert cache.lookup("ctx", "new")[0] is None
+    assert cache.lookup("ctx", "old")[0] == "old response"
+
+
+def test_try_generate_leaves_options_to_provider_defaults(provider):
+    """Test omitted options aren't overridden, so configured defaults apply."""
+    received = []
+
+    class ConfiguredProvider(FakeProvider):
+        default_max_tokens = 4096
+
+        def _generate(self, prompt, system_prompt=None, **options):
+            received.append(options)
+            return "ok"
+
+    assert ConfiguredProvider().try_generate("list files").response == "ok"
+    assert ConfiguredProvider().generate_batch(["a", "b"]) == ["ok", "ok"]
+    assert received == [{}, {}, {}]
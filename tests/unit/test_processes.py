@@ -0,0 +1,79 @@
+"""Tests for the processes plugin."""
+
+import os
+import sys
+
+import psutil
+import pytest
+
+from terminalbot.plugins import ProcessesPlugin
+from terminalbot.plugins.processes import (
+    _find_processes_proc,
+    _find_processes_psutil,
+    _join_cmdline,
+    _name_pattern,
+    _top_processes_psutil,
+)
+
+
+def test_find_process_finds_current_process():
+    """Test the running test process is found by name."""
+    name = psutil.Process().name()
+    result = ProcessesPlugin().find_process(name.upper())
+
+    assert result["success"]
+    assert os.getpid() in [proc["pid"] for proc in result["processes"]]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_proc_lookup_matches_psutil():
+    """Test the /proc fast path reports the same processes as psutil."""
+    pattern = _name_pattern(psutil.Process().name())
+
+    def own_entry(processes):
+        return next(
+            (p["name"], p["cmdline"]) for p in processes if p["pid"] == os.getpid()
+        )
+
+    assert own_entry(_find_processes_proc(pattern)) == own_entry(_find_processes_psutil(pattern))
+
+
+def test_list_top_processes_sorted_and_limited(monkeypatch):
+    """Test top processes are sorted by the requested metric and limited."""
+    slept = []
+    monkeypatch.setattr("terminalbot.plugins.processes.time.sleep", slept.append)
+
+    result = ProcessesPlugin().list_top_processes(sort_by="memory", limit=3)
+
+    assert result["success"]
+    memory = [proc["memory_percent"] for proc in result["processes"]]
+    assert 0 < len(memory) <= 3
+    assert memory == sorted(memory, reverse=True)
+    # Sorting by memory doesn't need a CPU sample
+    assert slept == []
+    assert _top_processes_psutil("memory", 3)
+    assert slept == []
+
+
+def test_check_if_running_stops_at_first_match():
+    """Test the quick check returns one match and the full check lists all."""
+    name = psutil.Process().name()
+    plugin = ProcessesPlugin()
+
+    quick = plugin.check_if_running(name)
+    full = plugin.check_if_running(name, include_list=True)
+
+    assert quick["running"] and quick["count"] == len(quick["processes"]) == 1
+    assert full["running"] and full["count"] == len(full["processes"]) >= 1
+    missing = plugin.check_if_running("no-such-process-name")
+    assert not missing["running"] and missing["count"] == 0
+
+
+def test_join_cmdline_matches_truncated_join():
+    """Test the bounded join equals joining everything and truncating."""
+    parts = ["/usr/bin/java", "-Xmx4g", "-cp", "x" * 500, "Main", "--flag"]
+
+    for limit in (1, 13, 14, 20, 100, 10_000):
+        assert _join_cmdline(parts, limit) == " ".join(parts)[:limit]
+    assert _join_cmdline(parts) == " ".join(parts)
+    assert _join_cmdline([], 100) == ""
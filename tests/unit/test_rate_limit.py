@@ -0,0 +1,24 @@
+"""Tests for the request rate limiter."""
+
+from terminalbot.utils import RateLimiter
+
+
+def test_rate_limiter_allows_burst_then_spaces_requests(monkeypatch):
+    """Test requests beyond the burst wait for refilled tokens."""
+    now = [1000.0]
+    sleeps = []
+    monkeypatch.setattr("terminalbot.utils.rate_limit.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("terminalbot.utils.rate_limit.time.sleep", sleeps.append)
+
+    limiter = RateLimiter(2, period=60)  # One token every 30s
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == []
+
+    limiter.acquire()
+    limiter.acquire()
+    assert sleeps == [30.0, 60.0]
+
+    now[0] += 90
+    limiter.acquire()
+    assert sleeps == [30.0, 60.0]
@@ -2,44 +2,39 @@
 
 import pytest
 
-from terminalbot.agent.rule_based import get_matcher
 
-
-def test_matcher_process_queries():
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("is nginx running?", "systemctl status nginx"),
+        ("check if apache is running", "systemctl status httpd"),
+    ],
+)
+def test_matcher_process_queries(matcher, query, expected):
     """Test matching process-related queries."""
-    matcher = get_matcher()
-
-    # Test various phrasings
-    result = matcher.match("is nginx running?")
-    assert result is not None
-    command, groups = result
-    assert "systemctl status nginx" in command
-
-    result = matcher.match("check if apache is running")
+    result = matcher.match(query)
     assert result is not None
     command, groups = result
-    assert "systemctl status httpd" in command
+    assert expected in command
 
 
-def test_matcher_system_queries():
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("show disk space", "df -h"),
+        ("check memory usage", "free -h"),
+    ],
+)
+def test_matcher_system_queries(matcher, query, expected):
     """Test matching system info queries."""
-    matcher = get_matcher()
-
-    result = matcher.match("show disk space")
+    result = matcher.match(query)
     assert result is not None
     command, groups = result
-    assert "df -h" in command
+    assert expected in command
 
-    result = matcher.match("check memory usage")
-    assert result is not None
-    command, groups = result
-    assert "free -h" in command
 
-
-def test_matcher_top_processes():
+def test_matcher_top_processes(matcher):
     """Test matching top process queries."""
-    matcher = get_matcher()
-
     result = matcher.match("top cpu processes")
     assert result is not None
     command, groups = result
@@ -47,19 +42,69 @@ def test_matcher_top_processes():
     assert "cpu" in command.lower()
 
 
-def test_matcher_no_match():
+def test_matcher_no_match(matcher):
     """Test queries that don't match any pattern."""
-    matcher = get_matcher()
-
     result = matcher.match("something completely random xyz123")
     assert result is None
 
 
-def test_matcher_with_parameters():
+def test_matcher_with_parameters(matcher):
     """Test matching queries with captured parameters."""
-    matcher = get_matcher()
-
     result = matcher.match("find process named python")
     assert result is not None
     command, groups = result
     assert "python" in command or len(groups) > 0
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "is nginx running?",
+        "show top cpu",
+        "check connection to example.com",
+        "show logs for sshd",
+        "list files in /var/log",
+        "please show me the failed services",
+        "who am i",
+    ],
+)
+def test_matcher_first_rule_wins(matcher, query):
+    """Test fused matching keeps per-pattern declaration-order priority."""
+    expected = None
+    for pattern, command_template in matcher.compiled_patterns:
+        match = pattern.search(query)
+        if match:
+            command = command_template
+            for i, group in enumerate(match.groups(), start=1):
+                if group:
+                    command = command.replace(f"{{{i}}}", group)
+            expected = (command, list(match.groups()))
+            break
+
+    assert matcher.match(query) == expected
+
+
+def test_matcher_suggestions_ranked_by_keywords(matcher):
+    """Test suggestions prefer rules sharing the most query keywords."""
+    suggestions = matcher.get_suggestions("disk usage please")
+    assert suggestions
+    assert "disk" in suggestions[0]
+
+    assert matcher.get_suggestions("xyz123 qwerty") == []
+
+
+def test_matcher_prefilter_keeps_substring_matches(matcher):
+    """Test the literal prefilter does not reject words embedded in others."""
+    # "check" only appears inside "rechecking"; the rule still matches
+    result = matcher.match("rechecking whether nginx is running")
+    assert result is not None
+    assert result[0] == "systemctl status nginx"
+
+    assert matcher.match("hello there") is None
+
+
+def test_matcher_batch_matches_individual_results(matcher):
+    """Test batch matching agrees with matching queries one at a time."""
+    queries = ["show disk space", "hello there", "show logs for sshd", "show disk space"]
+
+    assert matcher.match_batch(queries) == [matcher.match(query) for query in queries]
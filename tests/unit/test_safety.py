@@ -5,57 +5,113 @@ import pytest
 from terminalbot.agent.safety import SafetyValidator
 
 
-def test_dangerous_command_detection():
+@pytest.mark.parametrize(
+    "command,expected",
+    [
+        ("rm -rf /", True),
+        ("kill 1234", True),
+        ("systemctl stop nginx", True),
+        ("reboot", True),
+        # Safe commands
+        ("ls -la", False),
+        ("ps aux", False),
+        ("systemctl status nginx", False),
+    ],
+)
+def test_dangerous_command_detection(safety, command, expected):
     """Test detection of dangerous commands."""
-    safety = SafetyValidator()
+    assert safety.is_dangerous_command(command) is expected
+
+
+@pytest.mark.parametrize(
+    "target,expected,reason_part",
+    [
+        # Protected by PID
+        ("1", True, "PID 1"),
+        # Protected by name
+        ("systemd", True, "systemd"),
+        ("sshd", True, "sshd"),
+        # Not protected
+        ("12345", False, None),
+    ],
+)
+def test_protected_process_detection(safety, target, expected, reason_part):
+    """Test detection of protected processes."""
+    is_protected, reason = safety.is_protected_process(target)
+
+    assert is_protected is expected
+    if reason_part:
+        assert reason_part.lower() in reason.lower()
+
+
+@pytest.mark.parametrize(
+    "command,expected",
+    [
+        # Should require confirmation
+        ("kill 1234", True),
+        ("rm file.txt", True),
+        # Should not require confirmation
+        ("ls -la", False),
+        ("echo 'hello'", False),
+    ],
+)
+def test_requires_confirmation(safety, command, expected):
+    """Test confirmation requirement logic."""
+    requires, reason = safety.requires_confirmation(command)
+    assert requires is expected
 
-    assert safety.is_dangerous_command("rm -rf /")
-    assert safety.is_dangerous_command("kill 1234")
-    assert safety.is_dangerous_command("systemctl stop nginx")
-    assert safety.is_dangerous_command("reboot")
 
-    # Safe commands
-    assert not safety.is_dangerous_command("ls -la")
-    assert not safety.is_dangerous_command("ps aux")
-    assert not safety.is_dangerous_command("systemctl status nginx")
+def test_rebuild_patterns_after_settings_change(test_settings):
+    """Test matchers pick up changed safety settings after a rebuild."""
+    # Uses its own validator: the shared one must keep the default settings
+    safety = SafetyValidator(test_settings)
+    assert not safety.is_dangerous_command("dd if=/dev/zero of=/dev/sda")
 
+    test_settings.safety.dangerous_commands.append("dd")
+    safety.rebuild_patterns()
 
-def test_protected_process_detection():
-    """Test detection of protected processes."""
-    safety = SafetyValidator()
+    assert safety.is_dangerous_command("DD if=/dev/zero of=/dev/sda")
 
-    # Protected by PID
-    is_protected, reason = safety.is_protected_process("1")
-    assert is_protected
-    assert "PID 1" in reason
 
-    # Protected by name
-    is_protected, reason = safety.is_protected_process("systemd")
-    assert is_protected
-    assert "systemd" in reason.lower()
+def test_repeated_checks_are_memoized(test_settings):
+    """Test repeated command and name checks reuse earlier results."""
+    safety = SafetyValidator(test_settings)
 
-    is_protected, reason = safety.is_protected_process("sshd")
-    assert is_protected
+    for _ in range(3):
+        assert safety.is_dangerous_command("kill 1234")
+        assert safety.is_protected_process("sshd")[0]
 
-    # Not protected
-    is_protected, reason = safety.is_protected_process("12345")
-    assert not is_protected
+    assert safety._search_dangerous.cache_info().hits == 2
+    assert safety._lookup_protected_name.cache_info().hits == 2
 
 
-def test_requires_confirmation():
-    """Test confirmation requirement logic."""
-    safety = SafetyValidator()
+def test_process_matches_read_cmdline_lazily(safety):
+    """Test name matches read their command line once, and only when used."""
+    import json
+    import os
+
+    import psutil
+
+    from terminalbot.agent.safety import _ProcessMatch
+
+    class FakeProc:
+        calls = 0
 
-    # Should require confirmation
-    requires, reason = safety.requires_confirmation("kill 1234")
-    assert requires
+        def cmdline(self):
+            self.calls += 1
+            return ["python", "-m", "http.server"]
 
-    requires, reason = safety.requires_confirmation("rm file.txt")
-    assert requires
+    proc = FakeProc()
+    match = _ProcessMatch(proc, 42, "python")
+    assert proc.calls == 0
 
-    # Should not require confirmation
-    requires, reason = safety.requires_confirmation("ls -la")
-    assert not requires
+    assert match.to_dict() == {"pid": 42, "name": "python", "cmdline": "python -m http.server"}
+    assert match.cmdline == "python -m http.server"
+    assert proc.calls == 1
 
-    requires, reason = safety.requires_confirmation("echo 'hello'")
-    assert not requires
+    # The public result holds plain dicts, ready for JSON or display
+    name = psutil.Process().name()
+    is_safe, _, info = safety.validate_kill_command(f"pkill {name}")
+    assert is_safe
+    json.dumps(info)
+    assert os.getpid() in [process["pid"] for process in info["matching_processes"]]
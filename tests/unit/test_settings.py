@@ -0,0 +1,91 @@
+"""Tests for configuration loading."""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+import terminalbot.config
+from terminalbot.config import Settings
+
+
+def test_load_from_yaml_picks_up_changes(tmp_path):
+    """Test cached YAML is re-read once the file changes."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("execution:\n  command_timeout: 5\n")
+
+    assert Settings.load_from_yaml(config_path).execution.command_timeout == 5
+
+    config_path.write_text("execution:\n  command_timeout: 45\n")
+
+    assert Settings.load_from_yaml(config_path).execution.command_timeout == 45
+
+
+def test_load_from_yaml_returns_independent_settings(tmp_path):
+    """Test mutating one loaded Settings does not leak into the next load."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("safety:\n  protected_pids: [1]\n")
+
+    first = Settings.load_from_yaml(config_path)
+    first.safety.protected_pids.append(42)
+
+    second = Settings.load_from_yaml(config_path)
+    assert second.safety.protected_pids == [1]
+
+
+def test_defaults_json_matches_yaml():
+    """Test the generated defaults.json is in sync with defaults.yaml."""
+    config_dir = Path(terminalbot.config.__file__).parent
+    with open(config_dir / "defaults.yaml") as f:
+        yaml_defaults = yaml.safe_load(f)
+    with open(config_dir / "defaults.json") as f:
+        json_defaults = json.load(f)
+
+    assert json_defaults == yaml_defaults, "Run scripts/build_defaults.py"
+
+
+def test_patch_yaml_updates_single_key(tmp_path):
+    """Test patching one key keeps the rest of the file and parses scalars."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm:\n  primary: ollama\nexecution:\n  command_timeout: 5\n")
+
+    Settings.patch_yaml(config_path, "execution.command_timeout", "60")
+
+    settings = Settings.load_from_yaml(config_path)
+    assert settings.execution.command_timeout == 60
+    assert settings.llm.primary == "ollama"
+
+
+def test_patch_yaml_keeps_strings_for_string_settings(tmp_path):
+    """Test numeric- and boolean-looking values aren't reinterpreted for str fields."""
+    config_path = tmp_path / "config.yaml"
+
+    Settings.patch_yaml(config_path, "llm.ollama.model", "3.10")
+    Settings.patch_yaml(config_path, "output.theme", "no")
+    Settings.patch_yaml(config_path, "safety.protected_pids", "[1, 2]")
+
+    settings = Settings.load_from_yaml(config_path)
+    assert settings.llm.ollama.model == "3.10"
+    assert settings.output.theme == "no"
+    assert settings.safety.protected_pids == [1, 2]
+
+
+def test_patch_yaml_rejects_invalid_value(tmp_path):
+    """Test a value of the wrong type is refused before the file is written."""
+    config_path = tmp_path / "config.yaml"
+
+    with pytest.raises(ValueError):
+        Settings.patch_yaml(config_path, "execution.command_timeout", "soon")
+
+    assert not config_path.exists()
+
+
+def test_patch_yaml_rejects_unknown_key(tmp_path):
+    """Test unknown setting names are refused."""
+    config_path = tmp_path / "config.yaml"
+
+    with pytest.raises(KeyError):
+        Settings.patch_yaml(config_path, "llm.nonexistent", "x")
+
+    assert not config_path.exists()
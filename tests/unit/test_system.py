@@ -0,0 +1,56 @@
+"""Tests for the system plugin."""
+
+from terminalbot.executor import CommandExecutor
+from terminalbot.plugins import SystemPlugin
+
+
+class CountingExecutor(CommandExecutor):
+    """Executor that records the commands it runs."""
+
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def execute_sync(self, command, **kwargs):
+        self.commands.append(command)
+        return super().execute_sync(command, **kwargs)
+
+
+def test_system_info_is_cached():
+    """Test repeated system info queries reuse the first result."""
+    executor = CountingExecutor()
+    plugin = SystemPlugin(executor=executor)
+
+    first = plugin.get_system_info()
+    second = plugin.get_system_info()
+
+    assert first == second
+    assert executor.commands.count("uname -a") == 1
+    assert executor.commands.count("uptime") == 1
+
+
+def test_memory_and_disk_checks_run_in_process():
+    """Test memory and disk checks don't spawn commands."""
+    executor = CountingExecutor()
+    plugin = SystemPlugin(executor=executor)
+
+    memory = plugin.check_memory()
+    disk = plugin.check_disk_space()
+
+    assert memory["success"] and memory["total"] > 0
+    assert "Mem:" in memory["output"]
+    assert disk["success"] and "Mounted on" in disk["output"]
+    assert executor.commands == []
+
+
+def test_parse_os_release():
+    """Test os-release values are unquoted and comments skipped."""
+    from terminalbot.plugins.system import _parse_os_release
+
+    text = '# comment\nNAME="Fedora Linux"\nVERSION_ID=40\nPRETTY_NAME=\'Fedora Linux 40\'\n\n'
+
+    assert _parse_os_release(text) == {
+        "NAME": "Fedora Linux",
+        "VERSION_ID": "40",
+        "PRETTY_NAME": "Fedora Linux 40",
+    }